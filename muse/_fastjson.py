@@ -0,0 +1,53 @@
+"""JSON helpers — orjson when it's installed, the stdlib otherwise.
+
+One place for the optional-dependency check, shared by the config loader,
+the agents' tool schemas and tool-result serialization.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson is optional — fall back to the stdlib if it isn't installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON as UTF-8 bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_text(obj: Any) -> str:
+    """Lenient JSON text for tool results: unknown types fall back to str()."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits — let the stdlib handle it
+    return json.dumps(obj, default=str)
+
+
+def dumps_preview(obj: Any, limit: int = 200) -> str:
+    """Truncated JSON for log lines — slices the bytes before decoding."""
+    if ORJSON_AVAILABLE:
+        try:
+            raw = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+            return raw[:limit].decode(errors="replace")
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits — let the stdlib handle it
+    return json.dumps(obj, default=str)[:limit]
@@ -2,18 +2,233 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Literal
 
 from anthropic import Anthropic
-from anthropic.types import Message, ToolUseBlock, TextBlock
+from anthropic.types import Message, ToolUseBlock
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
+from muse._fastjson import dumps, dumps_preview, dumps_text
 from muse.config import config
 
 logger = logging.getLogger(__name__)
 
+def freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists into read-only mappings/tuples.
+
+    Used for module-level tool definitions, which are shared by every agent
+    instance and must never be mutated in place.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Inverse of ``freeze`` — plain dicts/lists the SDK can serialize."""
+    if isinstance(obj, Mapping):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+def compile_tool_adapters(
+    tool_definitions: Sequence[Mapping[str, Any]],
+    defaults: Mapping[str, Mapping[str, Any]],
+    backend: str | None = None,
+) -> dict[str, Callable[[Any, dict], Any]]:
+    """Generate one specialized adapter per tool from its input schema.
+
+    Each adapter is ``adapter(target, tool_input)`` and calls the method of the
+    same name on ``target`` (or on ``target.<backend>`` when ``backend`` is
+    given) with explicit keyword arguments: ``tool_input[k]``
+    for required properties, ``tool_input.get(k, default)`` for optional ones.
+    Schemas don't carry Python defaults, so they come from ``defaults``
+    (tool name → {property: default}); a property listed there is always
+    optional. Anything else optional defaults to None.
+
+    Keys are interned so lookups with an interned tool name (see
+    ``BaseAgent._run_tool_block``) hit the identity fast path.
+    """
+    dispatch = {}
+    for tool in tool_definitions:
+        name = sys.intern(tool["name"])
+        schema = tool["input_schema"]
+        required = set(schema.get("required", ()))
+        tool_defaults = defaults.get(name, {})
+
+        namespace: dict[str, Any] = {}
+        args = []
+        for prop in schema["properties"]:
+            if not prop.isidentifier():
+                raise ValueError(f"Tool {name!r} has a non-identifier property {prop!r}")
+            if prop in tool_defaults:
+                namespace[f"_default_{prop}"] = tool_defaults[prop]
+                args.append(f"{prop}=ti.get({prop!r}, _default_{prop})")
+            elif prop in required:
+                args.append(f"{prop}=ti[{prop!r}]")
+            else:
+                args.append(f"{prop}=ti.get({prop!r})")
+
+        receiver = f"target.{backend}" if backend else "target"
+        source = (
+            f"def _call_{name}(target, ti):\n"
+            f"    return {receiver}.{name}({', '.join(args)})\n"
+        )
+        exec(compile(source, f"<tool adapter {name}>", "exec"), namespace)
+        dispatch[name] = namespace[f"_call_{name}"]
+    return dispatch
+
+
+_JSON_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": dict[str, Any],
+}
+
+
+def _schema_type(prop: Mapping[str, Any]) -> Any:
+    """Python annotation for one JSON-schema property (enums become Literals)."""
+    if "enum" in prop:
+        return Literal[tuple(prop["enum"])]
+    if prop.get("type") == "array":
+        return list[_schema_type(prop.get("items", {}))]
+    return _JSON_TYPES.get(prop.get("type"), Any)
+
+
+def build_input_model(tool: Mapping[str, Any]) -> type[BaseModel]:
+    """Compile a tool's input_schema into a pydantic model, once.
+
+    Required properties are required fields; optional ones default to None
+    (callers dump with ``exclude_unset`` so the adapter defaults still apply).
+    Unknown keys are rejected.
+    """
+    schema = tool["input_schema"]
+    required = set(schema.get("required", ()))
+    fields = {
+        prop: (_schema_type(spec), ...) if prop in required
+        else (_schema_type(spec) | None, None)
+        for prop, spec in schema["properties"].items()
+    }
+    return create_model(
+        f"{tool['name']}_input", __config__=ConfigDict(extra="forbid"), **fields
+    )
+
+
+def _describe_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc'])) or 'input'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def tool(
+    name: str | None = None, schema: Mapping[str, Any] | None = None
+) -> Callable[[Callable], Callable]:
+    """Mark an agent method as the handler for a tool.
+
+    The method is called as ``method(agent, tool_input)``. ``name`` defaults
+    to the method name. Pass ``schema`` (``description`` + ``input_schema``)
+    to declare a new tool; without it the method overrides the generated
+    adapter for a tool already listed in the class's ``tool_schemas``.
+    Collected once per class by ``BaseAgent.__init_subclass__``.
+    """
+
+    def deco(fn: Callable) -> Callable:
+        fn._tool_name = sys.intern(name or fn.__name__)
+        fn._tool_schema = schema
+        return fn
+
+    return deco
+
+
+def _render_transcript(messages: list[dict]) -> str:
+    """Flatten stored messages into plain text for the compaction prompt."""
+    lines = []
+    for msg in messages:
+        role = msg["role"].upper()
+        content = msg["content"]
+        if isinstance(content, str):
+            lines.append(f"{role}: {content}")
+            continue
+        for block in content:
+            kind = block.get("type")
+            if kind == "text":
+                lines.append(f"{role}: {block['text']}")
+            elif kind == "tool_use":
+                lines.append(
+                    f"{role} called {block['name']} [{block['id']}]: "
+                    f"{dumps_text(block['input'])}"
+                )
+            elif kind == "tool_result":
+                lines.append(
+                    f"TOOL RESULT [{block['tool_use_id']}]: {str(block['content'])[:2000]}"
+                )
+    return "\n".join(lines)
+
+
+# Prompt-cache breakpoint. Everything up to and including a block marked with
+# this is cached server-side, so only byte-stable content should carry it.
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Appended to every agent's static system prompt. Batching independent calls
+# into one assistant turn saves a full model round trip per extra call, and
+# parallel_safe_tools lets those batched calls run concurrently.
+TOOL_BATCHING_GUIDANCE = """## Tool Calls
+
+When you need several tool calls that don't depend on each other's results \
+(e.g. looking up two date ranges, or a contact and their invoices), request \
+them all in the same response instead of one per turn. Only wait for a result \
+before the next call when that call actually depends on it — for example, \
+checking for conflicts before creating an event."""
+
+COMPACTION_PROMPT = """You compress conversation history for a music-business assistant.
+
+Summarize the transcript you are given so the assistant can continue the \
+conversation without it. Keep every concrete fact that might be referred to \
+later: names, dates, times, amounts, statuses, decisions, open questions, and \
+all IDs exactly as written (event, contact, invoice, post and tool_use IDs). \
+Drop pleasantries and repetition. Write terse bullet points, no more than \
+about 300 words."""
+
+# Output cap for the compaction summary. Compacting a prefix no larger than
+# this could not shrink the history, so it isn't attempted.
+_SUMMARY_MAX_TOKENS = 1024
+
+
+def _estimate_tokens(messages: Sequence[dict]) -> int:
+    """Rough token count (~4 chars per token) — good enough for a budget check."""
+    return len(dumps_text(messages)) // 4
+
+# Shared pool for running independent tool calls from one assistant turn
+# concurrently. Tool backends are I/O-bound (SQLite, Google APIs, ChromaDB).
+_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="muse-tool")
+
+
+# (ordinal, rendered line) for the current day; re-rendered on rollover
+_DATE_CACHE: list = [0, ""]
+
+
+def _today_str() -> str:
+    """Today's date line, formatted once per calendar day."""
+    today = date.today()
+    ordinal = today.toordinal()
+    if ordinal != _DATE_CACHE[0]:
+        _DATE_CACHE[:] = [ordinal, f"Today's date is {today.strftime('%A, %B %d, %Y')}."]
+    return _DATE_CACHE[1]
+
 
 class BaseAgent(ABC):
     """Base class for all Muse agents.
@@ -22,8 +237,77 @@ class BaseAgent(ABC):
     1. Send user message + tools to Claude
     2. If Claude wants to call a tool → execute it → feed result back → repeat
     3. If Claude returns a text response → return it to the user
+
+    Responses are streamed. Subclasses list read-only tools in
+    ``parallel_safe_tools``; those calls start as soon as their tool_use block
+    arrives and run concurrently with each other and the rest of the stream.
     """
 
+    __slots__ = (
+        "client",
+        "model",
+        "max_tool_rounds",
+        "max_history_tokens",
+        "keep_recent_turns",
+        "_system_prompt",
+        "_system_prompt_utf8",
+        "_tools",
+        "_tools_json",
+        "_segments",
+        "_segment_tokens",
+    )
+
+    parallel_safe_tools: frozenset[str] = frozenset()
+
+    # Declarative tools: ``tool_schemas`` are dispatched to the same-named
+    # method on ``getattr(self, tool_backend)`` through generated adapters
+    # (optional-argument defaults from ``tool_defaults``); ``@tool`` methods
+    # add or override entries. Agents that override ``execute_tool`` and
+    # ``tool_definitions`` themselves can leave these empty.
+    tool_backend: str | None = None
+    tool_schemas: Sequence[Mapping[str, Any]] = ()
+    tool_defaults: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+
+    # Built per class by __init_subclass__. Dispatch stays a dict of generated
+    # adapters rather than a generated ``match`` over tool names: CPython
+    # compiles literal case patterns to sequential comparisons, so a match
+    # only wins for the first couple of tools and loses ~2x on the last.
+    _DISPATCH: Mapping[str, Callable[[Any, dict], Any]] = MappingProxyType({})
+    _TOOL_DEFS: tuple[Mapping[str, Any], ...] = ()
+    _TOOL_MODELS: Mapping[str, type[BaseModel]] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        dispatch = dict(cls._DISPATCH)
+        base_defs = {tool["name"]: tool for tool in cls._TOOL_DEFS}
+        defs = dict(base_defs)
+
+        if "tool_schemas" in vars(cls):
+            dispatch.update(
+                compile_tool_adapters(cls.tool_schemas, cls.tool_defaults, cls.tool_backend)
+            )
+            defs.update((tool["name"], tool) for tool in cls.tool_schemas)
+
+        for attr in vars(cls).values():
+            tool_name = getattr(attr, "_tool_name", None)
+            if tool_name is None:
+                continue
+            dispatch[tool_name] = attr
+            if attr._tool_schema is not None:
+                defs[tool_name] = freeze({"name": tool_name, **attr._tool_schema})
+            elif tool_name not in defs:
+                raise TypeError(f"{cls.__name__}: @tool {tool_name!r} has no schema")
+
+        cls._DISPATCH = MappingProxyType(dispatch)
+        cls._TOOL_DEFS = tuple(defs.values())
+        # Input models are compiled once per schema; inherited tools reuse theirs
+        cls._TOOL_MODELS = MappingProxyType({
+            tool_name: cls._TOOL_MODELS[tool_name]
+            if tool is base_defs.get(tool_name)
+            else build_input_model(tool)
+            for tool_name, tool in defs.items()
+        })
+
     def __init__(
         self,
         client: Anthropic | None = None,
@@ -31,8 +315,19 @@ class BaseAgent(ABC):
     ):
         self.client = client or Anthropic(api_key=config.ANTHROPIC_API_KEY)
         self.model = model or config.MODEL
-        self.conversation_history: list[dict] = []
+        # Committed history: one immutable segment per completed turn cycle
+        self._segments: tuple[tuple[dict, ...], ...] = ()
+        # Estimated size of each segment, measured once when it is committed
+        self._segment_tokens: tuple[int, ...] = ()
         self.max_tool_rounds = 10  # safety limit to prevent infinite loops
+        self.max_history_tokens = 8000  # compact committed history beyond this
+        self.keep_recent_turns = 4  # turns kept verbatim when compacting
+
+        # Static request parts, built once so every round sends identical bytes
+        self._system_prompt = f"{self.system_prompt()}\n{TOOL_BATCHING_GUIDANCE}"
+        self._system_prompt_utf8 = self._system_prompt.encode()
+        self._tools = self._cached_tools()
+        self._tools_json = dumps(self._tools)
 
     @property
     @abstractmethod
@@ -45,26 +340,46 @@ class BaseAgent(ABC):
         """System prompt that defines the agent's personality and capabilities."""
         ...
 
-    @abstractmethod
-    def tool_definitions(self) -> list[dict]:
+    def tool_definitions(self) -> Sequence[Mapping[str, Any]]:
         """Anthropic-formatted tool definitions this agent can use."""
-        ...
+        return self._TOOL_DEFS
 
-    @abstractmethod
     def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
         """Execute a tool call and return the result.
-        
+
         Should return a string or dict that will be sent back to Claude
         as the tool result.
         """
-        ...
+        handler = self._DISPATCH.get(tool_name)
+        if handler is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        try:
+            parsed = self._TOOL_MODELS[tool_name].model_validate(tool_input)
+        except ValidationError as e:
+            return {"error": f"Invalid input for {tool_name}: {_describe_validation_error(e)}"}
+        return handler(self, parsed.model_dump(exclude_unset=True))
+
+    @property
+    def conversation_history(self) -> list[dict]:
+        """Committed history as a flat message list (a fresh list each call)."""
+        return list(chain.from_iterable(self._segments))
 
     def run(self, user_message: str) -> str:
         """Execute the full agent loop for a user message.
 
         Returns the agent's final text response.
+
+        The outgoing ``messages`` buffer is built once per call and only
+        appended to. The in-flight cycle (user message, tool_use / tool_result
+        exchanges, final answer) is its tail from ``cycle_start`` on and is
+        committed as one new history segment once the cycle completes, so
+        earlier segments are never touched and their byte prefix stays
+        cacheable.
         """
-        self.conversation_history.append({
+        self._maybe_compact()
+        messages = self._history_with_breakpoint()
+        cycle_start = len(messages)
+        messages.append({
             "role": "user",
             "content": user_message,
         })
@@ -72,74 +387,237 @@ class BaseAgent(ABC):
         for round_num in range(self.max_tool_rounds):
             logger.info(f"[{self.name}] Round {round_num + 1}")
 
-            response: Message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=self.system_prompt(),
-                tools=self.tool_definitions(),
-                messages=self.conversation_history,
-            )
+            response, started = self._stream_round(messages)
+
+            # One pass over the content, keyed on the block's type tag
+            tool_blocks: list[ToolUseBlock] = []
+            text_parts: list[str] = []
+            for block in response.content:
+                if block.type == "tool_use":
+                    tool_blocks.append(block)
+                elif block.type == "text":
+                    text_parts.append(block.text)
 
             # Check if Claude wants to use tools
             if response.stop_reason == "tool_use":
                 # Add the assistant's response (which contains tool_use blocks)
-                self.conversation_history.append({
+                # Dumped once, in JSON mode, at append time — never re-dumped
+                messages.append({
                     "role": "assistant",
-                    "content": [block.model_dump() for block in response.content],
+                    "content": [block.model_dump(mode="json") for block in response.content],
                 })
 
-                # Execute each tool call and collect results
-                tool_results = []
-                for block in response.content:
-                    if isinstance(block, ToolUseBlock):
-                        logger.info(
-                            f"[{self.name}] Calling tool: {block.name} "
-                            f"with input: {json.dumps(block.input, default=str)[:200]}"
-                        )
-                        try:
-                            result = self.execute_tool(block.name, block.input)
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": block.id,
-                                "content": json.dumps(result, default=str)
-                                if not isinstance(result, str)
-                                else result,
-                            })
-                        except Exception as e:
-                            logger.error(f"[{self.name}] Tool error: {e}")
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": block.id,
-                                "content": f"Error executing tool: {str(e)}",
-                                "is_error": True,
-                            })
+                # Collect results in block order: calls already started during
+                # the stream are awaited, the rest run serially now
+                tool_results = [
+                    started[block.id].result()
+                    if block.id in started
+                    else self._run_tool_block(block)
+                    for block in tool_blocks
+                ]
 
                 # Feed tool results back to Claude
-                self.conversation_history.append({
+                messages.append({
                     "role": "user",
                     "content": tool_results,
                 })
                 continue  # next round
 
-            # Claude returned a final text response — extract and return it
-            text_parts = []
-            for block in response.content:
-                if isinstance(block, TextBlock):
-                    text_parts.append(block.text)
-
+            # Claude returned a final text response — return it
             assistant_text = "\n".join(text_parts)
-            self.conversation_history.append({
+            messages.append({
                 "role": "assistant",
                 "content": assistant_text,
             })
+            segment = tuple(messages[cycle_start:])
+            self._segments += (segment,)
+            self._segment_tokens += (_estimate_tokens(segment),)
 
             logger.info(f"[{self.name}] Completed in {round_num + 1} round(s)")
             return assistant_text
 
-        # If we hit the safety limit
+        # If we hit the safety limit, drop the unfinished cycle so the committed
+        # history never ends on a dangling tool exchange
         logger.warning(f"[{self.name}] Hit max tool rounds ({self.max_tool_rounds})")
         return "I'm having trouble completing this request. Could you try rephrasing?"
 
+    # ── History Compaction ───────────────────────────────────────────
+
+    def _maybe_compact(self) -> None:
+        """Summarize older turns once committed history exceeds the token budget.
+
+        Everything before the last ``keep_recent_turns`` turns is replaced by
+        a summary exchange at the head of the history. It sits in front of
+        the history cache breakpoint, so the compacted prefix is itself cached
+        from the next request on. Failures leave the history untouched.
+        """
+        segments = self._segments
+        keep = self.keep_recent_turns
+        if len(segments) <= keep:
+            return
+        if sum(self._segment_tokens) <= self.max_history_tokens:
+            return
+        # When the recent turns alone carry the bulk, summarizing the short
+        # prefix in front of them would cost a model call and save nothing
+        if sum(self._segment_tokens[:-keep]) <= _SUMMARY_MAX_TOKENS:
+            return
+
+        old = list(chain.from_iterable(segments[:-keep]))
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=_SUMMARY_MAX_TOKENS,
+                system=COMPACTION_PROMPT,
+                messages=[{"role": "user", "content": _render_transcript(old)}],
+            )
+        except Exception as e:
+            logger.warning(f"[{self.name}] History compaction failed: {e}")
+            return
+
+        summary = "\n".join(
+            block.text for block in response.content if block.type == "text"
+        ).strip()
+        if not summary:
+            return
+
+        summary_segment = (
+            {"role": "user", "content": f"[Summary of our earlier conversation]\n{summary}"},
+            {"role": "assistant", "content": "Got it — I have the earlier context."},
+        )
+        self._segments = (summary_segment, *segments[-keep:])
+        self._segment_tokens = (
+            _estimate_tokens(summary_segment), *self._segment_tokens[-keep:]
+        )
+        logger.info(f"[{self.name}] Compacted {len(old)} history messages into a summary")
+
+    def _stream_round(self, messages: list[dict]) -> tuple[Message, dict[str, Future]]:
+        """Stream one model round, starting safe tool calls as their blocks finish.
+
+        A tool_use block is complete at its content_block_stop event, usually
+        well before the message ends. Calls in ``parallel_safe_tools`` are
+        submitted to the tool pool right away so they overlap the rest of the
+        decode. Once any other tool appears, later calls wait for the serial
+        pass so they still observe its effects in order.
+        """
+        started: dict[str, Future] = {}
+        ordered = True
+
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            system=self._system_blocks(),
+            tools=self._tools,
+            messages=messages,
+        ) as stream:
+            for event in stream:
+                if event.type != "content_block_stop":
+                    continue
+                block = stream.current_message_snapshot.content[event.index]
+                if block.type != "tool_use":
+                    continue
+                if ordered and block.name in self.parallel_safe_tools:
+                    started[block.id] = _TOOL_POOL.submit(self._run_tool_block, block)
+                else:
+                    ordered = False
+            response = stream.get_final_message()
+
+        return response, started
+
+    def _run_tool_block(self, block: ToolUseBlock) -> dict:
+        """Execute one tool_use block and wrap the outcome as a tool_result."""
+        # Names parsed off the wire are fresh strings; interning once here
+        # lets dispatch dicts (interned keys) match on identity.
+        tool_name = sys.intern(block.name)
+        logger.info(
+            f"[{self.name}] Calling tool: {tool_name} "
+            f"with input: {dumps_preview(block.input)}"
+        )
+        try:
+            result = self.execute_tool(tool_name, block.input)
+            return {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": dumps_text(result)
+                if not isinstance(result, str)
+                else result,
+            }
+        except Exception as e:
+            logger.error(f"[{self.name}] Tool error: {e}")
+            return {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": f"Error executing tool: {str(e)}",
+                "is_error": True,
+            }
+
+    def system_prompt_bytes(self) -> bytes:
+        """The static system prompt exactly as sent, pre-encoded as UTF-8."""
+        return self._system_prompt_utf8
+
+    def tool_definitions_json(self) -> bytes:
+        """The tools payload exactly as sent (cache breakpoint included), pre-encoded.
+
+        For callers that build or log request bodies themselves; the SDK
+        path in ``run`` still hands ``self._tools`` to the client, which
+        owns body encoding.
+        """
+        return self._tools_json
+
+    # ── Prompt Caching ───────────────────────────────────────────────
+
+    def _system_blocks(self) -> list[dict]:
+        """System prompt as content blocks: cached static prompt + dynamic preamble.
+
+        The static prompt never changes within a process, so it carries the
+        cache breakpoint. Anything that changes over time (today's date) goes
+        in a separate, uncached block after it so the cached prefix stays
+        byte-identical.
+        """
+        return [
+            {"type": "text", "text": self._system_prompt, "cache_control": CACHE_CONTROL},
+            {"type": "text", "text": self._today_block()},
+        ]
+
+    def _cached_tools(self) -> list[dict]:
+        """Tool definitions with a cache breakpoint on the last tool.
+
+        Anthropic caches the tools block up to the last marked entry.
+        Works on plain copies (thawed if the definitions are frozen), so the
+        module-level definitions are left untouched. Called once from
+        ``__init__``; ``run`` sends the stored ``self._tools``.
+        """
+        tools = [thaw(tool) for tool in self.tool_definitions()]
+        if tools:
+            tools[-1] = {**tools[-1], "cache_control": CACHE_CONTROL}
+        return tools
+
+    def _history_with_breakpoint(self) -> list[dict]:
+        """Committed history with a cache breakpoint on its last block.
+
+        The breakpoint goes on a copy of the last committed block, so every
+        round of the current cycle (and the first round of the next one)
+        reuses the cached history prefix. Stored entries are never mutated.
+        """
+        if not self._segments:
+            return []
+
+        *head, last = self.conversation_history
+        content = last["content"]
+        if not content:
+            return [*head, last]
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+        else:
+            blocks = [*content[:-1], {**content[-1], "cache_control": CACHE_CONTROL}]
+
+        return [*head, {**last, "content": blocks}]
+
+    @staticmethod
+    def _today_block() -> str:
+        """Dynamic preamble with today's date, kept out of the cached prefix."""
+        return _today_str()
+
     def reset(self) -> None:
         """Clear conversation history for a fresh start."""
-        self.conversation_history = []
+        self._segments = ()
+        self._segment_tokens = ()
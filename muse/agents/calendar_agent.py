@@ -5,19 +5,21 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
-from muse.agents.base import BaseAgent
+from muse.agents.base import BaseAgent, freeze, tool
 from muse.config import config
 from muse.models.events import GigEvent, EventType, EventStatus
-from muse.tools.calendar_tools import CalendarTools
 
 logger = logging.getLogger(__name__)
 
 
-CALENDAR_SYSTEM_PROMPT = f"""You are the Calendar Agent for Muse, an AI manager for independent musicians.
+@lru_cache(maxsize=4)
+def _build_system_prompt(artist_name: str, timezone: str) -> str:
+    """Compose the calendar prompt on first use; cached per artist settings."""
+    return f"""You are the Calendar Agent for Muse, an AI manager for independent musicians.
 
-Your job is to manage the artist's schedule — creating events, detecting conflicts, finding availability, and keeping their calendar organized. The artist's name is {config.ARTIST_NAME}.
+Your job is to manage the artist's schedule — creating events, detecting conflicts, finding availability, and keeping their calendar organized. The artist's name is {artist_name}.
 
 ## How You Operate
 
@@ -40,11 +42,10 @@ You are conversational, efficient, and music-industry-aware. You understand the
 4. Parse natural language dates and times. "Next Thursday" means the coming Thursday. "This weekend" means the upcoming Saturday/Sunday.
 5. After creating an event, show a clean summary of what was created.
 6. When listing events, organize them chronologically and group by day.
-7. Use the artist's timezone: {config.DEFAULT_TIMEZONE}.
+7. Use the artist's timezone: {timezone}.
 
 ## Important
 
-- Today's date is {datetime.now().strftime("%A, %B %d, %Y")}.
 - Always use 12-hour time format (e.g., "2:00 PM") when talking to the user.
 - Always use ISO 8601 format when calling tools.
 - If the user mentions pay, always capture it — this feeds into the invoice agent later.
@@ -52,7 +53,7 @@ You are conversational, efficient, and music-industry-aware. You understand the
 """
 
 
-TOOL_DEFINITIONS = [
+_RAW_TOOL_DEFINITIONS = [
     {
         "name": "create_event",
         "description": (
@@ -232,88 +233,89 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Shared by every instance — frozen so nothing can mutate it in place
+TOOL_DEFINITIONS = tuple(freeze(tool) for tool in _RAW_TOOL_DEFINITIONS)
+
+# Python-side defaults for optional tool arguments (schemas don't carry them)
+_TOOL_DEFAULTS = {
+    "find_availability": {"duration_hours": 2.0},
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp. datetimes are immutable, so results are shared."""
+    return datetime.fromisoformat(value)
+
+
+# Read-only tools that can run concurrently when Claude batches them in one turn
+_READ_ONLY_TOOLS = frozenset({"list_events", "check_conflicts", "find_availability"})
+
 
 class CalendarAgent(BaseAgent):
     """Manages the artist's calendar — gigs, sessions, rehearsals, lessons."""
 
+    # Each tool calls the same-named CalendarTools method on self.calendar;
+    # create_event needs a GigEvent built first, so it has its own handler
+    tool_backend = "calendar"
+    tool_schemas = TOOL_DEFINITIONS
+    tool_defaults = _TOOL_DEFAULTS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Imported here so loading the agent module doesn't pull in the
+        # tools' dependencies until the agent is actually used
+        from muse.tools.calendar_tools import CalendarTools
+
         self.calendar = CalendarTools()
 
     @property
     def name(self) -> str:
         return "CalendarAgent"
 
-    def system_prompt(self) -> str:
-        return CALENDAR_SYSTEM_PROMPT
-
-    def tool_definitions(self) -> list[dict]:
-        return TOOL_DEFINITIONS
-
-    def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
-        """Route tool calls to CalendarTools methods."""
-
-        if tool_name == "create_event":
-            event = GigEvent(
-                title=tool_input["title"],
-                event_type=EventType(tool_input["event_type"]),
-                venue=tool_input.get("venue", ""),
-                address=tool_input.get("address", ""),
-                start_time=datetime.fromisoformat(tool_input["start_time"]),
-                end_time=datetime.fromisoformat(tool_input["end_time"]),
-                load_in_time=(
-                    datetime.fromisoformat(tool_input["load_in_time"])
-                    if tool_input.get("load_in_time")
-                    else None
-                ),
-                soundcheck_time=(
-                    datetime.fromisoformat(tool_input["soundcheck_time"])
-                    if tool_input.get("soundcheck_time")
-                    else None
-                ),
-                set_time=(
-                    datetime.fromisoformat(tool_input["set_time"])
-                    if tool_input.get("set_time")
-                    else None
-                ),
-                pay=tool_input.get("pay"),
-                pay_notes=tool_input.get("pay_notes", ""),
-                contact_name=tool_input.get("contact_name", ""),
-                contact_info=tool_input.get("contact_info", ""),
-                gear_notes=tool_input.get("gear_notes", ""),
-                status=EventStatus(tool_input.get("status", "confirmed")),
-                notes=tool_input.get("notes", ""),
-            )
-            return self.calendar.create_event(event)
-
-        elif tool_name == "list_events":
-            return self.calendar.list_events(
-                start_date=tool_input["start_date"],
-                end_date=tool_input["end_date"],
-                event_type=tool_input.get("event_type"),
-            )
-
-        elif tool_name == "update_event":
-            return self.calendar.update_event(
-                event_id=tool_input["event_id"],
-                updates=tool_input["updates"],
-            )
-
-        elif tool_name == "delete_event":
-            return self.calendar.delete_event(event_id=tool_input["event_id"])
-
-        elif tool_name == "check_conflicts":
-            return self.calendar.check_conflicts(
-                start_time=tool_input["start_time"],
-                end_time=tool_input["end_time"],
-            )
+    @property
+    def parallel_safe_tools(self) -> frozenset[str]:
+        # Local mode shares one SQLite connection behind a lock, so these
+        # calls are safe to submit together — the queries themselves still
+        # run one at a time, but they overlap with the rest of the stream.
+        # The shared Google API client (httplib2) is not thread-safe, so
+        # keep those calls serial.
+        return _READ_ONLY_TOOLS if self.calendar.use_local else frozenset()
 
-        elif tool_name == "find_availability":
-            return self.calendar.find_availability(
-                search_start=tool_input["search_start"],
-                search_end=tool_input["search_end"],
-                duration_hours=tool_input.get("duration_hours", 2.0),
-            )
+    def system_prompt(self) -> str:
+        return _build_system_prompt(config.ARTIST_NAME, config.DEFAULT_TIMEZONE)
 
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+    @tool()
+    def create_event(self, tool_input: dict) -> dict:
+        """Build a GigEvent from the tool input and create it."""
+        event = GigEvent(
+            title=tool_input["title"],
+            event_type=EventType(tool_input["event_type"]),
+            venue=tool_input.get("venue", ""),
+            address=tool_input.get("address", ""),
+            start_time=_parse_iso(tool_input["start_time"]),
+            end_time=_parse_iso(tool_input["end_time"]),
+            load_in_time=(
+                _parse_iso(tool_input["load_in_time"])
+                if tool_input.get("load_in_time")
+                else None
+            ),
+            soundcheck_time=(
+                _parse_iso(tool_input["soundcheck_time"])
+                if tool_input.get("soundcheck_time")
+                else None
+            ),
+            set_time=(
+                _parse_iso(tool_input["set_time"])
+                if tool_input.get("set_time")
+                else None
+            ),
+            pay=tool_input.get("pay"),
+            pay_notes=tool_input.get("pay_notes", ""),
+            contact_name=tool_input.get("contact_name", ""),
+            contact_info=tool_input.get("contact_info", ""),
+            gear_notes=tool_input.get("gear_notes", ""),
+            status=EventStatus(tool_input.get("status", "confirmed")),
+            notes=tool_input.get("notes", ""),
+        )
+        return self.calendar.create_event(event)
@@ -7,18 +7,19 @@ and cross-references invoices and calendar events for full context.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
-from muse.agents.base import BaseAgent
+from muse.agents.base import BaseAgent, freeze
 from muse.config import config
-from muse.tools.crm_tools import CRMTools
 
 logger = logging.getLogger(__name__)
 
 # ── System Prompt ────────────────────────────────────────────────────
 
-CRM_SYSTEM_PROMPT = f"""You are the CRM Agent for Muse, an AI manager for independent musicians.
+@lru_cache(maxsize=4)
+def _build_system_prompt(artist_name: str) -> str:
+    """Compose the CRM prompt on first use; cached per artist name."""
+    return f"""You are the CRM Agent for Muse, an AI manager for independent musicians.
 
 Your job is to help the artist manage their professional network — venues, studios, promoters, labels, collaborators, and other music industry contacts. You track who they work with, keep notes from meetings and calls, and help them maintain strong relationships.
 
@@ -51,15 +52,14 @@ Good CRM means knowing the history:
 
 ## Important
 
-- Today's date is {datetime.now().strftime("%A, %B %d, %Y")}.
-- The artist's name is {config.ARTIST_NAME}.
+- The artist's name is {artist_name}.
 - Be concise. Musicians are busy. Don't over-explain.
 - When searching, try to find the right contact by name before asking the artist for an ID.
 """
 
 # ── Tool Definitions ─────────────────────────────────────────────────
 
-TOOL_DEFINITIONS = [
+_RAW_TOOL_DEFINITIONS = [
     {
         "name": "add_contact",
         "description": (
@@ -281,6 +281,26 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Shared by every instance — frozen so nothing can mutate it in place
+TOOL_DEFINITIONS = tuple(freeze(tool) for tool in _RAW_TOOL_DEFINITIONS)
+
+# Python-side defaults for optional tool arguments (schemas don't carry them)
+_TOOL_DEFAULTS = {
+    "add_contact": {
+        "contact_person": "",
+        "email": "",
+        "phone": "",
+        "role": "other",
+        "notes": "",
+        "typical_rate": "",
+        "payment_terms": "",
+        "preferred_payment": "",
+        "relationship_status": "active",
+    },
+    "search_contacts": {"query": ""},
+    "add_interaction": {"interaction_type": "general"},
+}
+
 
 # ── Agent Class ──────────────────────────────────────────────────────
 
@@ -288,8 +308,19 @@ TOOL_DEFINITIONS = [
 class CRMAgent(BaseAgent):
     """Manages the artist's professional network — contacts, interactions, relationships."""
 
+    __slots__ = ("crm",)
+
+    # Each tool calls the same-named CRMTools method on self.crm
+    tool_backend = "crm"
+    tool_schemas = TOOL_DEFINITIONS
+    tool_defaults = _TOOL_DEFAULTS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Imported here so loading the agent module doesn't pull in the
+        # tools' dependencies until the agent is actually used
+        from muse.tools.crm_tools import CRMTools
+
         self.crm = CRMTools()
 
     @property
@@ -297,70 +328,4 @@ class CRMAgent(BaseAgent):
         return "CRMAgent"
 
     def system_prompt(self) -> str:
-        return CRM_SYSTEM_PROMPT
-
-    def tool_definitions(self) -> list[dict]:
-        return TOOL_DEFINITIONS
-
-    def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
-        """Route tool calls to CRMTools methods."""
-
-        if tool_name == "add_contact":
-            return self.crm.add_contact(
-                organization_name=tool_input["organization_name"],
-                contact_person=tool_input.get("contact_person", ""),
-                email=tool_input.get("email", ""),
-                phone=tool_input.get("phone", ""),
-                role=tool_input.get("role", "other"),
-                tags=tool_input.get("tags"),
-                notes=tool_input.get("notes", ""),
-                typical_rate=tool_input.get("typical_rate", ""),
-                payment_terms=tool_input.get("payment_terms", ""),
-                preferred_payment=tool_input.get("preferred_payment", ""),
-                relationship_status=tool_input.get("relationship_status", "active"),
-                first_contact_date=tool_input.get("first_contact_date"),
-            )
-
-        elif tool_name == "search_contacts":
-            return self.crm.search_contacts(
-                query=tool_input.get("query", ""),
-                role=tool_input.get("role"),
-                tag=tool_input.get("tag"),
-                relationship_status=tool_input.get("relationship_status"),
-            )
-
-        elif tool_name == "get_contact":
-            return self.crm.get_contact(
-                contact_id=tool_input["contact_id"],
-            )
-
-        elif tool_name == "update_contact":
-            return self.crm.update_contact(
-                contact_id=tool_input["contact_id"],
-                updates=tool_input["updates"],
-            )
-
-        elif tool_name == "add_interaction":
-            return self.crm.add_interaction(
-                contact_id=tool_input["contact_id"],
-                interaction_type=tool_input.get("interaction_type", "general"),
-                content=tool_input["content"],
-                interaction_date=tool_input.get("interaction_date"),
-                follow_up_date=tool_input.get("follow_up_date"),
-            )
-
-        elif tool_name == "list_interactions":
-            return self.crm.list_interactions(
-                contact_id=tool_input["contact_id"],
-                start_date=tool_input.get("start_date"),
-                end_date=tool_input.get("end_date"),
-                interaction_type=tool_input.get("interaction_type"),
-            )
-
-        elif tool_name == "get_contact_summary":
-            return self.crm.get_contact_summary(
-                contact_id=tool_input["contact_id"],
-            )
-
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        return _build_system_prompt(config.ARTIST_NAME)
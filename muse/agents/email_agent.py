@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
-from muse.agents.base import BaseAgent
+from muse.agents.base import BaseAgent, freeze
 from muse.config import config
-from muse.tools.email_tools import EmailTools
 
 logger = logging.getLogger(__name__)
 
 
-EMAIL_SYSTEM_PROMPT = f"""You are the Email Agent for Muse, an AI manager for independent musicians.
+@lru_cache(maxsize=4)
+def _build_system_prompt(artist_name: str, artist_email: str, timezone: str) -> str:
+    """Compose the Email prompt on first use; cached per artist settings."""
+    return f"""You are the Email Agent for Muse, an AI manager for independent musicians.
 
-Your job is to manage the artist's email — reading the inbox, searching for messages, drafting replies, and extracting gig details from booking emails. The artist's name is {config.ARTIST_NAME}.
+Your job is to manage the artist's email — reading the inbox, searching for messages, drafting replies, and extracting gig details from booking emails. The artist's name is {artist_name}.
 
 ## How You Operate
 
@@ -59,18 +59,17 @@ When drafting replies to booking emails, use a professional but personable tone:
 - Acknowledge the offer warmly
 - Confirm or ask about specific details (times, pay, gear)
 - Keep it concise — no fluff
-- Sign off with the artist's name: {config.ARTIST_NAME}
+- Sign off with the artist's name: {artist_name}
 
 ## Important
 
-- Today's date is {datetime.now().strftime("%A, %B %d, %Y")}.
-- The artist's email is {config.ARTIST_EMAIL or "not configured"}.
-- The artist's timezone is {config.DEFAULT_TIMEZONE}.
+- The artist's email is {artist_email or "not configured"}.
+- The artist's timezone is {timezone}.
 - Be concise. Musicians are busy. Don't over-explain.
 """
 
 
-TOOL_DEFINITIONS = [
+_RAW_TOOL_DEFINITIONS = [
     {
         "name": "list_emails",
         "description": (
@@ -218,9 +217,11 @@ TOOL_DEFINITIONS = [
     {
         "name": "modify_labels",
         "description": (
-            "Modify labels on an email message. Use to archive (remove INBOX), "
+            "Modify labels on one or more email messages. Use to archive (remove INBOX), "
             "star (add STARRED), mark as read (remove UNREAD), mark as important "
-            "(add IMPORTANT), or move to trash (add TRASH)."
+            "(add IMPORTANT), or move to trash (add TRASH). When applying the same "
+            "change to several messages (e.g. inbox triage), pass them all in "
+            "message_ids in a single call."
         ),
         "input_schema": {
             "type": "object",
@@ -229,6 +230,11 @@ TOOL_DEFINITIONS = [
                     "type": "string",
                     "description": "The ID of the email message",
                 },
+                "message_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "IDs of several messages that get the same label change",
+                },
                 "add_labels": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -240,7 +246,7 @@ TOOL_DEFINITIONS = [
                     "description": "Labels to remove (e.g. ['INBOX', 'UNREAD'])",
                 },
             },
-            "required": ["message_id"],
+            "required": [],
         },
     },
     {
@@ -264,12 +270,32 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Shared by every instance — frozen so nothing can mutate it in place
+TOOL_DEFINITIONS = tuple(freeze(tool) for tool in _RAW_TOOL_DEFINITIONS)
+
+# Python-side defaults for optional tool arguments (schemas don't carry them)
+_TOOL_DEFAULTS = {
+    "list_emails": {"max_results": 20, "label": "INBOX", "unread_only": False},
+    "search_emails": {"max_results": 10},
+}
+
 
 class EmailAgent(BaseAgent):
     """Manages the artist's email — inbox triage, replies, gig detail extraction."""
 
+    __slots__ = ("email",)
+
+    # Each tool calls the same-named EmailTools method on self.email
+    tool_backend = "email"
+    tool_schemas = TOOL_DEFINITIONS
+    tool_defaults = _TOOL_DEFAULTS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Imported here so loading the agent module doesn't pull in the
+        # tools' dependencies until the agent is actually used
+        from muse.tools.email_tools import EmailTools
+
         self.email = EmailTools()
 
     @property
@@ -277,63 +303,6 @@ class EmailAgent(BaseAgent):
         return "EmailAgent"
 
     def system_prompt(self) -> str:
-        return EMAIL_SYSTEM_PROMPT
-
-    def tool_definitions(self) -> list[dict]:
-        return TOOL_DEFINITIONS
-
-    def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
-        """Route tool calls to EmailTools methods."""
-
-        if tool_name == "list_emails":
-            return self.email.list_emails(
-                max_results=tool_input.get("max_results", 20),
-                label=tool_input.get("label", "INBOX"),
-                unread_only=tool_input.get("unread_only", False),
-            )
-
-        elif tool_name == "read_email":
-            return self.email.read_email(
-                message_id=tool_input["message_id"],
-            )
-
-        elif tool_name == "search_emails":
-            return self.email.search_emails(
-                query=tool_input["query"],
-                max_results=tool_input.get("max_results", 10),
-            )
-
-        elif tool_name == "draft_reply":
-            return self.email.draft_reply(
-                message_id=tool_input["message_id"],
-                body=tool_input["body"],
-                cc=tool_input.get("cc"),
-            )
-
-        elif tool_name == "create_draft":
-            return self.email.create_draft(
-                to=tool_input["to"],
-                subject=tool_input["subject"],
-                body=tool_input["body"],
-                cc=tool_input.get("cc"),
-            )
-
-        elif tool_name == "send_draft":
-            return self.email.send_draft(
-                draft_id=tool_input["draft_id"],
-            )
-
-        elif tool_name == "modify_labels":
-            return self.email.modify_labels(
-                message_id=tool_input["message_id"],
-                add_labels=tool_input.get("add_labels"),
-                remove_labels=tool_input.get("remove_labels"),
-            )
-
-        elif tool_name == "extract_gig_details":
-            return self.email.extract_gig_details(
-                message_id=tool_input["message_id"],
-            )
-
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        return _build_system_prompt(
+            config.ARTIST_NAME, config.ARTIST_EMAIL, config.DEFAULT_TIMEZONE
+        )
@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
-from muse.agents.base import BaseAgent
+from muse.agents.base import BaseAgent, freeze
 from muse.config import config
-from muse.tools.invoice_tools import InvoiceTools
 
 logger = logging.getLogger(__name__)
 
 
-INVOICE_SYSTEM_PROMPT = f"""You are the Invoice Agent for Muse, an AI manager for independent musicians.
+@lru_cache(maxsize=4)
+def _build_system_prompt(artist_name: str, artist_email: str, payment_terms: str) -> str:
+    """Compose the invoice prompt on first use; cached per artist settings."""
+    return f"""You are the Invoice Agent for Muse, an AI manager for independent musicians.
 
-Your job is to help the artist create invoices, track payments, generate professional PDFs, and understand their income. The artist's name is {config.ARTIST_NAME}.
+Your job is to help the artist create invoices, track payments, generate professional PDFs, and understand their income. The artist's name is {artist_name}.
 
 ## How You Operate
 
@@ -33,7 +33,7 @@ You are conversational, efficient, and music-industry-aware. You understand how
 
 1. When creating an invoice, always show a preview first and confirm with the artist before generating the PDF.
 2. Each invoice gets a sequential number (INV-YYYY-NNN format).
-3. Default payment terms are "{config.INVOICE_PAYMENT_TERMS}" unless the artist specifies otherwise.
+3. Default payment terms are "{payment_terms}" unless the artist specifies otherwise.
 4. When the artist mentions a gig with pay, help them turn it into an invoice — suggest line items based on the details.
 5. For income summaries, break down by paid vs. outstanding and flag overdue invoices.
 6. Be smart about line item descriptions — include the event type, venue, and date for clarity.
@@ -50,15 +50,14 @@ You are conversational, efficient, and music-industry-aware. You understand how
 
 ## Important
 
-- Today's date is {datetime.now().strftime("%A, %B %d, %Y")}.
-- The artist's name is {config.ARTIST_NAME}.
-- The artist's email is {config.ARTIST_EMAIL or "not configured"}.
-- Default payment terms: {config.INVOICE_PAYMENT_TERMS}.
+- The artist's name is {artist_name}.
+- The artist's email is {artist_email or "not configured"}.
+- Default payment terms: {payment_terms}.
 - Be concise. Musicians are busy. Don't over-explain.
 """
 
 
-TOOL_DEFINITIONS = [
+_RAW_TOOL_DEFINITIONS = [
     {
         "name": "create_invoice",
         "description": (
@@ -252,12 +251,38 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Shared by every instance — frozen so nothing can mutate it in place
+TOOL_DEFINITIONS = tuple(freeze(tool) for tool in _RAW_TOOL_DEFINITIONS)
+
+# Python-side defaults for optional tool arguments (schemas don't carry them)
+_TOOL_DEFAULTS = {
+    "create_invoice": {"client_email": "", "notes": ""},
+    "mark_paid": {"payment_notes": ""},
+}
+
 
 class InvoiceAgent(BaseAgent):
     """Manages invoicing — creation, PDF generation, payment tracking, income reporting."""
 
+    __slots__ = ("invoices",)
+
+    # Each tool calls the same-named InvoiceTools method on self.invoices
+    tool_backend = "invoices"
+    tool_schemas = TOOL_DEFINITIONS
+    tool_defaults = _TOOL_DEFAULTS
+
+    # Reads plus PDF rendering: each opens its own SQLite connection and
+    # writes only its own invoice's file, so a batch can run concurrently
+    parallel_safe_tools = frozenset(
+        {"get_invoice", "list_invoices", "get_income_summary", "generate_pdf"}
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Imported here so loading the agent module doesn't pull in the
+        # tools' dependencies until the agent is actually used
+        from muse.tools.invoice_tools import InvoiceTools
+
         self.invoices = InvoiceTools()
 
     @property
@@ -265,59 +290,6 @@ class InvoiceAgent(BaseAgent):
         return "InvoiceAgent"
 
     def system_prompt(self) -> str:
-        return INVOICE_SYSTEM_PROMPT
-
-    def tool_definitions(self) -> list[dict]:
-        return TOOL_DEFINITIONS
-
-    def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
-        """Route tool calls to InvoiceTools methods."""
-
-        if tool_name == "create_invoice":
-            return self.invoices.create_invoice(
-                client_name=tool_input["client_name"],
-                line_items=tool_input["line_items"],
-                client_email=tool_input.get("client_email", ""),
-                notes=tool_input.get("notes", ""),
-                payment_terms=tool_input.get("payment_terms"),
-                due_date=tool_input.get("due_date"),
-            )
-
-        elif tool_name == "list_invoices":
-            return self.invoices.list_invoices(
-                start_date=tool_input.get("start_date"),
-                end_date=tool_input.get("end_date"),
-                status=tool_input.get("status"),
-            )
-
-        elif tool_name == "get_invoice":
-            return self.invoices.get_invoice(
-                invoice_id=tool_input["invoice_id"],
-            )
-
-        elif tool_name == "update_invoice":
-            return self.invoices.update_invoice(
-                invoice_id=tool_input["invoice_id"],
-                updates=tool_input["updates"],
-            )
-
-        elif tool_name == "mark_paid":
-            return self.invoices.mark_paid(
-                invoice_id=tool_input["invoice_id"],
-                payment_date=tool_input.get("payment_date"),
-                payment_notes=tool_input.get("payment_notes", ""),
-            )
-
-        elif tool_name == "generate_pdf":
-            return self.invoices.generate_pdf(
-                invoice_id=tool_input["invoice_id"],
-            )
-
-        elif tool_name == "get_income_summary":
-            return self.invoices.get_income_summary(
-                start_date=tool_input.get("start_date"),
-                end_date=tool_input.get("end_date"),
-            )
-
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        return _build_system_prompt(
+            config.ARTIST_NAME, config.ARTIST_EMAIL, config.INVOICE_PAYMENT_TERMS
+        )
@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
-from muse.agents.base import BaseAgent
+from muse.agents.base import BaseAgent, freeze
 from muse.config import config
-from muse.tools.social_tools import SocialTools
 
 logger = logging.getLogger(__name__)
 
 
-SOCIAL_SYSTEM_PROMPT = f"""You are the Social Media Agent for Muse, an AI manager for independent musicians.
+@lru_cache(maxsize=4)
+def _build_system_prompt(artist_name: str) -> str:
+    """Compose the social prompt on first use; cached per artist name."""
+    return f"""You are the Social Media Agent for Muse, an AI manager for independent musicians.
 
 Your job is to help the artist create compelling Instagram content that sounds authentically like them — not like a generic AI. You do this using voice matching: before writing any caption, you ALWAYS retrieve the artist's voice samples to match their tone.
 
-The artist's name is {config.ARTIST_NAME}. The platform is Instagram.
+The artist's name is {artist_name}. The platform is Instagram.
 
 ## How You Operate
 
@@ -53,14 +53,13 @@ The artist's name is {config.ARTIST_NAME}. The platform is Instagram.
 
 ## Important
 
-- Today's date is {datetime.now().strftime("%A, %B %d, %Y")}.
-- The artist's name is {config.ARTIST_NAME}.
+- The artist's name is {artist_name}.
 - Platform: Instagram (local drafts only — the artist posts manually).
 - All posts start as DRAFTS. The artist copies the caption to post on Instagram.
 """
 
 
-TOOL_DEFINITIONS = [
+_RAW_TOOL_DEFINITIONS = [
     {
         "name": "get_voice_context",
         "description": (
@@ -279,12 +278,41 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Shared by every instance — frozen so nothing can mutate it in place
+TOOL_DEFINITIONS = tuple(freeze(tool) for tool in _RAW_TOOL_DEFINITIONS)
+
+# Python-side defaults for optional tool arguments (schemas don't carry them)
+_TOOL_DEFAULTS = {
+    "get_voice_context": {"n_results": 3},
+    "create_post_draft": {
+        "platform": "instagram",
+        "post_type": "feed",
+        "image_description": "",
+        "voice_category": "",
+        "notes": "",
+    },
+    "list_posts": {"limit": 20},
+    "add_voice_sample": {"category": "other", "source": "manual"},
+    "generate_hashtags": {"count": 15},
+}
+
 
 class SocialAgent(BaseAgent):
     """Manages social media — caption generation, voice matching, post drafting."""
 
+    __slots__ = ("social",)
+
+    # Each tool calls the same-named SocialTools method on self.social
+    tool_backend = "social"
+    tool_schemas = TOOL_DEFINITIONS
+    tool_defaults = _TOOL_DEFAULTS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Imported here so loading the agent module doesn't pull in the
+        # tools' dependencies until the agent is actually used
+        from muse.tools.social_tools import SocialTools
+
         self.social = SocialTools()
 
     @property
@@ -292,70 +320,4 @@ class SocialAgent(BaseAgent):
         return "SocialAgent"
 
     def system_prompt(self) -> str:
-        return SOCIAL_SYSTEM_PROMPT
-
-    def tool_definitions(self) -> list[dict]:
-        return TOOL_DEFINITIONS
-
-    def execute_tool(self, tool_name: str, tool_input: dict) -> Any:
-        """Route tool calls to SocialTools methods."""
-
-        if tool_name == "get_voice_context":
-            return self.social.get_voice_context(
-                query=tool_input["query"],
-                n_results=tool_input.get("n_results", 3),
-                category=tool_input.get("category"),
-            )
-
-        elif tool_name == "create_post_draft":
-            return self.social.create_post_draft(
-                caption=tool_input["caption"],
-                platform=tool_input.get("platform", "instagram"),
-                post_type=tool_input.get("post_type", "feed"),
-                hashtags=tool_input.get("hashtags"),
-                image_description=tool_input.get("image_description", ""),
-                voice_category=tool_input.get("voice_category", ""),
-                notes=tool_input.get("notes", ""),
-            )
-
-        elif tool_name == "list_posts":
-            return self.social.list_posts(
-                status=tool_input.get("status"),
-                platform=tool_input.get("platform"),
-                limit=tool_input.get("limit", 20),
-            )
-
-        elif tool_name == "get_post":
-            return self.social.get_post(
-                post_id=tool_input["post_id"],
-            )
-
-        elif tool_name == "update_post":
-            return self.social.update_post(
-                post_id=tool_input["post_id"],
-                updates=tool_input["updates"],
-            )
-
-        elif tool_name == "delete_post":
-            return self.social.delete_post(
-                post_id=tool_input["post_id"],
-            )
-
-        elif tool_name == "add_voice_sample":
-            return self.social.add_voice_sample(
-                text=tool_input["text"],
-                category=tool_input.get("category", "other"),
-                source=tool_input.get("source", "manual"),
-            )
-
-        elif tool_name == "list_voice_samples":
-            return self.social.list_voice_samples()
-
-        elif tool_name == "generate_hashtags":
-            return self.social.generate_hashtags(
-                topic=tool_input["topic"],
-                count=tool_input.get("count", 15),
-            )
-
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        return _build_system_prompt(config.ARTIST_NAME)
@@ -1,56 +1,97 @@
 """Muse configuration — loads environment variables and app settings."""
 
-import json
+import functools
 import os
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
-
-load_dotenv()
+from muse._fastjson import loads
 
 # Project root: two levels up from this file (muse/muse/config.py → project root)
 # config.py is at muse/muse/config.py, one up = muse/, two up = project root
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 def _resolve(path: str) -> str:
     """Resolve a path relative to the project root if not already absolute."""
-    if os.path.isabs(path):
-        return path
-    return os.path.join(PROJECT_ROOT, path)
+    return str(p if (p := Path(path)).is_absolute() else PROJECT_ROOT / p)
+
+
+@functools.cache
+def _ensure_env_loaded() -> None:
+    """Load .env into the environment, once, right before settings are read."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _env(name: str, default: str) -> Callable[[], str]:
+    """default_factory reading an env var (after .env is loaded)."""
+
+    def factory() -> str:
+        _ensure_env_loaded()
+        return os.getenv(name, default)
+
+    return factory
+
 
+def _env_path(name: str, default: str) -> Callable[[], str]:
+    """default_factory reading a path env var, resolved against the project root."""
 
+    def factory() -> str:
+        _ensure_env_loaded()
+        return _resolve(os.getenv(name, default))
+
+    return factory
+
+
+# Not frozen: the Streamlit UI updates ARTIST_NAME / DEFAULT_TIMEZONE at runtime
+@dataclass(slots=True)
 class Config:
     # Anthropic
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
+    ANTHROPIC_API_KEY: str = field(default_factory=_env("ANTHROPIC_API_KEY", ""))
     MODEL: str = "claude-sonnet-4-20250514"
 
     # Google OAuth — single token with both Calendar + Gmail scopes
-    GOOGLE_CREDENTIALS_PATH: str = _resolve(os.getenv("GOOGLE_CREDENTIALS_PATH", "credentials.json"))
-    GOOGLE_TOKEN_PATH: str = _resolve(os.getenv("GOOGLE_TOKEN_PATH", "token.json"))
-    GOOGLE_SCOPES: list[str] = [
+    GOOGLE_CREDENTIALS_PATH: str = field(default_factory=_env_path("GOOGLE_CREDENTIALS_PATH", "credentials.json"))
+    GOOGLE_TOKEN_PATH: str = field(default_factory=_env_path("GOOGLE_TOKEN_PATH", "token.json"))
+    GOOGLE_SCOPES: list[str] = field(default_factory=lambda: [
         "https://www.googleapis.com/auth/calendar",
         "https://www.googleapis.com/auth/gmail.modify",
-    ]
+    ])
 
     # App
-    DEFAULT_TIMEZONE: str = os.getenv("DEFAULT_TIMEZONE", "America/New_York")
-    ARTIST_NAME: str = os.getenv("ARTIST_NAME", "Artist")
-    ARTIST_EMAIL: str = os.getenv("ARTIST_EMAIL", "")
+    DEFAULT_TIMEZONE: str = field(default_factory=_env("DEFAULT_TIMEZONE", "America/New_York"))
+    ARTIST_NAME: str = field(default_factory=_env("ARTIST_NAME", "Artist"))
+    ARTIST_EMAIL: str = field(default_factory=_env("ARTIST_EMAIL", ""))
 
     # Invoicing
-    INVOICE_OUTPUT_DIR: str = _resolve(os.getenv("INVOICE_OUTPUT_DIR", "invoices"))
-    INVOICE_PAYMENT_TERMS: str = os.getenv("INVOICE_PAYMENT_TERMS", "Due upon receipt")
+    INVOICE_OUTPUT_DIR: str = field(default_factory=_env_path("INVOICE_OUTPUT_DIR", "invoices"))
+    INVOICE_PAYMENT_TERMS: str = field(default_factory=_env("INVOICE_PAYMENT_TERMS", "Due upon receipt"))
 
     # Social Media
-    CHROMADB_PATH: str = _resolve(os.getenv("CHROMADB_PATH", "chroma_db"))
-    SOCIAL_PLATFORM: str = os.getenv("SOCIAL_PLATFORM", "instagram")
+    CHROMADB_PATH: str = field(default_factory=_env_path("CHROMADB_PATH", "chroma_db"))
+    SOCIAL_PLATFORM: str = field(default_factory=_env("SOCIAL_PLATFORM", "instagram"))
 
     # Database
-    DB_PATH: str = _resolve(os.getenv("DB_PATH", "muse.db"))
+    DB_PATH: str = field(default_factory=_env_path("DB_PATH", "muse.db"))
+
+
+@functools.cache
+def _get_config() -> Config:
+    global config
+    config = Config()
+    return config
 
 
-config = Config()
+def __getattr__(name: str):
+    # `config` is built (and .env loaded) on first access, not at import
+    if name == "config":
+        return _get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_google_client_config() -> Optional[dict]:
@@ -60,43 +101,58 @@ def get_google_client_config() -> Optional[dict]:
     1. Streamlit secrets (cloud): st.secrets["google_oauth"] → builds a dict
     2. Local file: reads credentials.json from disk
 
+    Both are parsed once and cached, since the UI calls this on every
+    Streamlit rerun. The file cache is keyed on its mtime, so a
+    credentials.json added or replaced while the app runs is picked up.
+
     Returns:
         Dict in the format expected by Flow.from_client_config(), or None.
     """
-    # 1. Try st.secrets (Streamlit Cloud)
+    # 1. Try st.secrets (Streamlit Cloud). Under `streamlit run` the module is
+    # already loaded; anywhere else there are no secrets, so skip the import.
     try:
-        import streamlit as st
-
-        if hasattr(st, "secrets") and "google_oauth" in st.secrets:
+        st = sys.modules.get("streamlit")
+        if st is not None and hasattr(st, "secrets") and "google_oauth" in st.secrets:
             from muse.utils.env import get_app_url
 
-            secrets = dict(st.secrets["google_oauth"])
-            app_url = get_app_url()
-            return {
-                "web": {
-                    "client_id": secrets["client_id"],
-                    "client_secret": secrets["client_secret"],
-                    "project_id": secrets.get("project_id", ""),
-                    "auth_uri": secrets.get(
-                        "auth_uri", "https://accounts.google.com/o/oauth2/auth"
-                    ),
-                    "token_uri": secrets.get(
-                        "token_uri", "https://oauth2.googleapis.com/token"
-                    ),
-                    "auth_provider_x509_cert_url": secrets.get(
-                        "auth_provider_x509_cert_url",
-                        "https://www.googleapis.com/oauth2/v1/certs",
-                    ),
-                    "redirect_uris": [app_url],
-                }
-            }
+            return _client_config_from_secrets(get_app_url())
     except Exception:
         pass
 
     # 2. Fall back to credentials.json file (local dev)
-    creds_path = config.GOOGLE_CREDENTIALS_PATH
-    if os.path.exists(creds_path):
-        with open(creds_path) as f:
-            return json.load(f)
-
-    return None
+    creds_path = _get_config().GOOGLE_CREDENTIALS_PATH
+    try:
+        mtime = os.stat(creds_path).st_mtime_ns
+    except OSError:
+        return None
+    return _load_credentials_file(creds_path, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _client_config_from_secrets(app_url: str) -> dict:
+    import streamlit as st
+
+    secrets = dict(st.secrets["google_oauth"])
+    return {
+        "web": {
+            "client_id": secrets["client_id"],
+            "client_secret": secrets["client_secret"],
+            "project_id": secrets.get("project_id", ""),
+            "auth_uri": secrets.get(
+                "auth_uri", "https://accounts.google.com/o/oauth2/auth"
+            ),
+            "token_uri": secrets.get(
+                "token_uri", "https://oauth2.googleapis.com/token"
+            ),
+            "auth_provider_x509_cert_url": secrets.get(
+                "auth_provider_x509_cert_url",
+                "https://www.googleapis.com/oauth2/v1/certs",
+            ),
+            "redirect_uris": [app_url],
+        }
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials_file(path: str, mtime_ns: int) -> dict:
+    return loads(Path(path).read_bytes())
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ContactRole(str, Enum):
@@ -40,9 +39,30 @@ class InteractionType(str, Enum):
     GENERAL = "general"
 
 
+# Emoji used by Contact.to_summary — built once at import, not per render
+_ROLE_EMOJI: dict[ContactRole, str] = {
+    ContactRole.VENUE: "\U0001f3e0",
+    ContactRole.STUDIO: "\U0001f399\ufe0f",
+    ContactRole.PROMOTER: "\U0001f4e3",
+    ContactRole.LABEL: "\U0001f4bf",
+    ContactRole.MANAGER: "\U0001f4cb",
+    ContactRole.COLLABORATOR: "\U0001f91d",
+    ContactRole.OTHER: "\U0001f464",
+}
+
+_STATUS_EMOJI: dict[RelationshipStatus, str] = {
+    RelationshipStatus.ACTIVE: "\U0001f7e2",
+    RelationshipStatus.INACTIVE: "\U0001f7e1",
+    RelationshipStatus.PROSPECT: "\U0001f535",
+    RelationshipStatus.PAST: "\u26ab",
+}
+
+
 class Contact(BaseModel):
     """Represents a client/contact in the artist's professional network."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     organization_name: str = Field(description="Organization or venue name")
     contact_person: str = Field(default="", description="Primary contact person name")
@@ -64,43 +84,25 @@ class Contact(BaseModel):
 
     def to_summary(self) -> str:
         """Human-readable summary for chat responses."""
-        role_emoji = {
-            ContactRole.VENUE: "\U0001f3e0",
-            ContactRole.STUDIO: "\U0001f399\ufe0f",
-            ContactRole.PROMOTER: "\U0001f4e3",
-            ContactRole.LABEL: "\U0001f4bf",
-            ContactRole.MANAGER: "\U0001f4cb",
-            ContactRole.COLLABORATOR: "\U0001f91d",
-            ContactRole.OTHER: "\U0001f464",
-        }.get(self.role, "\U0001f464")
-
-        status_emoji = {
-            RelationshipStatus.ACTIVE: "\U0001f7e2",
-            RelationshipStatus.INACTIVE: "\U0001f7e1",
-            RelationshipStatus.PROSPECT: "\U0001f535",
-            RelationshipStatus.PAST: "\u26ab",
-        }.get(self.relationship_status, "\u26aa")
-
-        lines = [f"{role_emoji} **{self.organization_name}** {status_emoji}"]
-        if self.contact_person:
-            lines.append(f"  Contact: {self.contact_person}")
-        if self.email:
-            lines.append(f"  Email: {self.email}")
-        if self.phone:
-            lines.append(f"  Phone: {self.phone}")
-        if self.typical_rate:
-            lines.append(f"  Rate: {self.typical_rate}")
-        if self.tags:
-            lines.append(f"  Tags: {', '.join(self.tags)}")
-        if self.last_contact_date:
-            lines.append(f"  Last contact: {self.last_contact_date}")
-
-        return "\n".join(lines)
+        role_emoji = _ROLE_EMOJI.get(self.role, "\U0001f464")
+        status_emoji = _STATUS_EMOJI.get(self.relationship_status, "\u26aa")
+        # Optional lines are falsy when their field is empty and get filtered out
+        return "\n".join(filter(None, (
+            f"{role_emoji} **{self.organization_name}** {status_emoji}",
+            self.contact_person and f"  Contact: {self.contact_person}",
+            self.email and f"  Email: {self.email}",
+            self.phone and f"  Phone: {self.phone}",
+            self.typical_rate and f"  Rate: {self.typical_rate}",
+            self.tags and f"  Tags: {', '.join(self.tags)}",
+            self.last_contact_date and f"  Last contact: {self.last_contact_date}",
+        )))
 
 
 class Interaction(BaseModel):
     """Represents a logged interaction/note for a contact."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     contact_id: str = Field(description="ID of the linked contact")
     interaction_type: InteractionType = Field(default=InteractionType.GENERAL)
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EmailLabel(str, Enum):
@@ -20,9 +20,14 @@ class EmailLabel(str, Enum):
     SPAM = "SPAM"
 
 
+_DATE_FMT = "%b %d, %I:%M %p"
+
+
 class EmailMessage(BaseModel):
     """Represents an email message."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     thread_id: Optional[str] = None
     subject: str = Field(default="", description="Email subject line")
@@ -41,18 +46,21 @@ class EmailMessage(BaseModel):
         """Human-readable one-line summary for chat responses."""
         read_icon = "" if self.is_read else " [NEW]"
         attach_icon = " [ATTACH]" if self.has_attachments else ""
-        date_str = self.date.strftime("%b %d, %I:%M %p") if self.date else "Unknown date"
+        date_str = self.date.strftime(_DATE_FMT) if self.date else "Unknown date"
+        snippet = self.snippet if len(self.snippet) <= 100 else f"{self.snippet[:100]}…"
         return (
             f"{read_icon}{attach_icon} {self.subject}\n"
             f"  From: {self.sender}\n"
             f"  Date: {date_str}\n"
-            f"  {self.snippet[:100]}..."
+            f"  {snippet}"
         )
 
 
 class EmailDraft(BaseModel):
     """Represents a draft email for artist approval before sending."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     to: list[str] = Field(description="Recipient email addresses")
     cc: list[str] = Field(default_factory=list, description="CC addresses")
@@ -78,6 +86,8 @@ class EmailDraft(BaseModel):
 class ExtractedGigDetails(BaseModel):
     """Gig details extracted from a booking email."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     venue: str = Field(default="", description="Venue name")
     address: str = Field(default="", description="Venue address")
     date: Optional[str] = Field(default=None, description="Gig date (ISO format if parseable)")
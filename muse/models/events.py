@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EventType(str, Enum):
@@ -24,9 +24,28 @@ class EventStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# strftime formats shared by the renderers below
+_TIME_FMT = "%I:%M %p"
+_START_FMT = "%A, %B %d · %I:%M %p"
+
+# Emoji used by GigEvent.to_summary — built once at import, not per render
+_EVENT_EMOJI: dict[EventType, str] = {
+    EventType.GIG: "🎸",
+    EventType.SESSION: "🎙️",
+    EventType.REHEARSAL: "🥁",
+    EventType.LESSON: "📚",
+    EventType.MEETING: "🤝",
+    EventType.OTHER: "📅",
+}
+
+_EVENT_TYPE_TITLE: dict[EventType, str] = {t: t.value.title() for t in EventType}
+
+
 class GigEvent(BaseModel):
     """Represents any music-related calendar event."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None  # Google Calendar event ID
     title: str = Field(description="Event title, e.g. 'Live at The Earl' or 'Session at West End Sound'")
     event_type: EventType = Field(description="Type of event")
@@ -47,71 +66,46 @@ class GigEvent(BaseModel):
 
     def to_calendar_description(self) -> str:
         """Format event details for Google Calendar description field."""
-        lines = []
-        if self.event_type:
-            lines.append(f"Type: {self.event_type.value.title()}")
-        if self.venue:
-            lines.append(f"Venue: {self.venue}")
-        if self.load_in_time:
-            lines.append(f"Load-in: {self.load_in_time.strftime('%I:%M %p')}")
-        if self.soundcheck_time:
-            lines.append(f"Soundcheck: {self.soundcheck_time.strftime('%I:%M %p')}")
-        if self.set_time:
-            lines.append(f"Set Time: {self.set_time.strftime('%I:%M %p')}")
-        if self.pay is not None:
-            lines.append(f"Pay: ${self.pay:,.2f}")
-        if self.pay_notes:
-            lines.append(f"Pay Details: {self.pay_notes}")
-        if self.contact_name:
-            lines.append(f"Contact: {self.contact_name}")
-        if self.contact_info:
-            lines.append(f"Contact Info: {self.contact_info}")
-        if self.gear_notes:
-            lines.append(f"Gear: {self.gear_notes}")
-        if self.notes:
-            lines.append(f"Notes: {self.notes}")
-        return "\n".join(lines)
+        return "\n".join(filter(None, (
+            self.event_type and f"Type: {_EVENT_TYPE_TITLE[self.event_type]}",
+            self.venue and f"Venue: {self.venue}",
+            self.load_in_time and f"Load-in: {self.load_in_time.strftime(_TIME_FMT)}",
+            self.soundcheck_time and f"Soundcheck: {self.soundcheck_time.strftime(_TIME_FMT)}",
+            self.set_time and f"Set Time: {self.set_time.strftime(_TIME_FMT)}",
+            self.pay is not None and f"Pay: ${self.pay:,.2f}",
+            self.pay_notes and f"Pay Details: {self.pay_notes}",
+            self.contact_name and f"Contact: {self.contact_name}",
+            self.contact_info and f"Contact Info: {self.contact_info}",
+            self.gear_notes and f"Gear: {self.gear_notes}",
+            self.notes and f"Notes: {self.notes}",
+        )))
 
     def to_summary(self) -> str:
         """Human-readable summary for chat responses."""
-        emoji = {
-            EventType.GIG: "🎸",
-            EventType.SESSION: "🎙️",
-            EventType.REHEARSAL: "🥁",
-            EventType.LESSON: "📚",
-            EventType.MEETING: "🤝",
-            EventType.OTHER: "📅",
-        }.get(self.event_type, "📅")
-
-        lines = [f"{emoji} **{self.title}**"]
-        if self.venue:
-            lines.append(f"📍 {self.venue}")
-        if self.address:
-            lines.append(f"   {self.address}")
-
-        date_str = self.start_time.strftime("%A, %B %d")
-        time_str = f"{self.start_time.strftime('%I:%M %p')} - {self.end_time.strftime('%I:%M %p')}"
-        lines.append(f"🕐 {date_str} · {time_str}")
-
-        if self.load_in_time:
-            lines.append(f"🚪 Load-in: {self.load_in_time.strftime('%I:%M %p')}")
-        if self.set_time:
-            lines.append(f"🎤 Set: {self.set_time.strftime('%I:%M %p')}")
-        if self.pay is not None:
-            lines.append(f"💰 ${self.pay:,.2f}")
-        if self.pay_notes:
-            lines.append(f"   {self.pay_notes}")
-        if self.contact_name:
-            lines.append(f"👤 Contact: {self.contact_name}")
-        if self.gear_notes:
-            lines.append(f"🎒 Gear: {self.gear_notes}")
-
-        return "\n".join(lines)
+        emoji = _EVENT_EMOJI.get(self.event_type, "📅")
+        # Date and start time come from one strftime call
+        when = f"{self.start_time.strftime(_START_FMT)} - {self.end_time.strftime(_TIME_FMT)}"
+
+        # Optional lines are falsy when their field is empty and get filtered out
+        return "\n".join(filter(None, (
+            f"{emoji} **{self.title}**",
+            self.venue and f"📍 {self.venue}",
+            self.address and f"   {self.address}",
+            f"🕐 {when}",
+            self.load_in_time and f"🚪 Load-in: {self.load_in_time.strftime(_TIME_FMT)}",
+            self.set_time and f"🎤 Set: {self.set_time.strftime(_TIME_FMT)}",
+            self.pay is not None and f"💰 ${self.pay:,.2f}",
+            self.pay_notes and f"   {self.pay_notes}",
+            self.contact_name and f"👤 Contact: {self.contact_name}",
+            self.gear_notes and f"🎒 Gear: {self.gear_notes}",
+        )))
 
 
 class ConflictInfo(BaseModel):
     """Information about a scheduling conflict."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     conflicting_event: GigEvent
     overlap_type: str = Field(description="'full' if completely overlapping, 'partial' if partially")
     message: str = Field(description="Human-readable conflict description")
@@ -120,6 +114,8 @@ class ConflictInfo(BaseModel):
 class AvailabilitySlot(BaseModel):
     """An available time slot."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     start: datetime
     end: datetime
     duration_hours: float
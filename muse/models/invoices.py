@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class InvoiceStatus(str, Enum):
@@ -17,9 +16,21 @@ class InvoiceStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Emoji used by Invoice.to_preview — built once at import, not per render
+_STATUS_EMOJI: dict[InvoiceStatus, str] = {
+    InvoiceStatus.DRAFT: "📝",
+    InvoiceStatus.SENT: "📤",
+    InvoiceStatus.PAID: "✅",
+    InvoiceStatus.OVERDUE: "⚠️",
+    InvoiceStatus.CANCELLED: "❌",
+}
+
+
 class InvoiceLineItem(BaseModel):
     """A single line item on an invoice."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     description: str = Field(description="Line item description, e.g. 'Live performance at The Earl'")
     amount: float = Field(description="Amount in USD")
@@ -31,6 +42,8 @@ class InvoiceLineItem(BaseModel):
 class Invoice(BaseModel):
     """Represents an invoice for music services."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     invoice_number: str = Field(default="", description="Human-readable invoice number, e.g. INV-2026-001")
     artist_name: str = Field(default="", description="Artist/business name (the payee)")
@@ -50,40 +63,30 @@ class Invoice(BaseModel):
     @property
     def total_amount(self) -> float:
         """Calculate total from line items."""
-        return sum(item.amount for item in self.line_items)
+        return sum([item.amount for item in self.line_items])
 
     def to_preview(self) -> str:
         """Format invoice for artist review before generating PDF."""
-        status_emoji = {
-            InvoiceStatus.DRAFT: "📝",
-            InvoiceStatus.SENT: "📤",
-            InvoiceStatus.PAID: "✅",
-            InvoiceStatus.OVERDUE: "⚠️",
-            InvoiceStatus.CANCELLED: "❌",
-        }.get(self.status, "📄")
-
-        lines = [
+        status_emoji = _STATUS_EMOJI.get(self.status, "📄")
+        rows = "".join(
+            f"\n    - {item.description}"
+            f"{f' @ {item.venue}' if item.venue else ''}"
+            f"{f' ({item.event_date})' if item.event_date else ''}"
+            f" — ${item.amount:,.2f}"
+            for item in self.line_items
+        )
+
+        # Optional lines are falsy when their field is empty and get filtered out
+        return "\n".join(filter(None, (
             f"{status_emoji} **Invoice {self.invoice_number}**",
             f"  Status: {self.status.value.upper()}",
             f"  To: {self.client_name}",
-        ]
-        if self.client_email:
-            lines.append(f"  Email: {self.client_email}")
-        lines.append(f"  Date: {self.invoice_date or 'Not set'}")
-        lines.append(f"  Due: {self.due_date or self.payment_terms}")
-        lines.append("")
-        lines.append("  **Line Items:**")
-        for item in self.line_items:
-            date_str = f" ({item.event_date})" if item.event_date else ""
-            venue_str = f" @ {item.venue}" if item.venue else ""
-            lines.append(f"    - {item.description}{venue_str}{date_str} — ${item.amount:,.2f}")
-        lines.append("")
-        lines.append(f"  **Total: ${self.total_amount:,.2f}**")
-        if self.notes:
-            lines.append(f"  Notes: {self.notes}")
-        if self.payment_date:
-            lines.append(f"  Paid: {self.payment_date}")
-            if self.payment_notes:
-                lines.append(f"  Payment ref: {self.payment_notes}")
-
-        return "\n".join(lines)
+            self.client_email and f"  Email: {self.client_email}",
+            f"  Date: {self.invoice_date or 'Not set'}",
+            f"  Due: {self.due_date or self.payment_terms}",
+            f"\n  **Line Items:**{rows}",
+            f"\n  **Total: ${self.total_amount:,.2f}**",
+            self.notes and f"  Notes: {self.notes}",
+            self.payment_date and f"  Paid: {self.payment_date}",
+            self.payment_date and self.payment_notes and f"  Payment ref: {self.payment_notes}",
+        )))
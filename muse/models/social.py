@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PostType(str, Enum):
@@ -34,9 +34,35 @@ class VoiceCategory(str, Enum):
     OTHER = "other"
 
 
+_SCHEDULED_FMT = "%A, %B %d at %I:%M %p"
+
+# Emoji used by SocialPost.to_preview — built once at import, not per render
+_TYPE_EMOJI: dict[PostType, str] = {
+    PostType.FEED: "📸",
+    PostType.REEL: "🎬",
+    PostType.STORY: "📱",
+    PostType.CAROUSEL: "🎠",
+}
+
+_STATUS_EMOJI: dict[PostStatus, str] = {
+    PostStatus.DRAFT: "📝",
+    PostStatus.SCHEDULED: "⏰",
+    PostStatus.POSTED: "✅",
+    PostStatus.ARCHIVED: "📦",
+}
+
+# Display names for enum values, e.g. "gig_promo" → "Gig Promo"
+_POST_TYPE_TITLE: dict[PostType, str] = {t: t.value.title() for t in PostType}
+_VOICE_TITLE: dict[VoiceCategory, str] = {
+    v: v.value.replace("_", " ").title() for v in VoiceCategory
+}
+
+
 class SocialPost(BaseModel):
     """Represents a social media post draft."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     platform: str = Field(default="instagram", description="Social media platform")
     post_type: PostType = Field(default=PostType.FEED, description="Type of post")
@@ -58,54 +84,30 @@ class SocialPost(BaseModel):
 
     def to_preview(self) -> str:
         """Format post draft for artist review."""
-        type_emoji = {
-            PostType.FEED: "📸",
-            PostType.REEL: "🎬",
-            PostType.STORY: "📱",
-            PostType.CAROUSEL: "🎠",
-        }.get(self.post_type, "📱")
-
-        status_emoji = {
-            PostStatus.DRAFT: "📝",
-            PostStatus.SCHEDULED: "⏰",
-            PostStatus.POSTED: "✅",
-            PostStatus.ARCHIVED: "📦",
-        }.get(self.status, "📝")
-
-        lines = [
+        type_emoji = _TYPE_EMOJI.get(self.post_type, "📱")
+        status_emoji = _STATUS_EMOJI.get(self.status, "📝")
+        # Optional lines are falsy when their field is empty and get filtered out
+        return "\n".join(filter(None, (
             f"--- {type_emoji} {self.platform.upper()} POST DRAFT ---",
             f"  Status: {status_emoji} {self.status.value.upper()}",
-            f"  Type: {self.post_type.value.title()}",
-        ]
-
-        if self.image_description:
-            lines.append(f"  Visual: {self.image_description}")
-
-        lines.append(f"\n  Caption:\n  {self.caption}")
-
-        if self.hashtags:
-            lines.append(f"\n  Hashtags: {' '.join(self.hashtags)}")
-
-        if self.voice_category:
-            lines.append(f"\n  Voice Style: {self.voice_category.value.replace('_', ' ').title()}")
-
-        if self.scheduled_time:
-            lines.append(
-                f"  Scheduled: {self.scheduled_time.strftime('%A, %B %d at %I:%M %p')}"
-            )
-
-        if self.notes:
-            lines.append(f"  Notes: {self.notes}")
-
-        lines.append("  --- END DRAFT ---")
-        lines.append("\n  Tell me to edit it, or copy the caption to post on Instagram.")
-
-        return "\n".join(lines)
+            f"  Type: {_POST_TYPE_TITLE[self.post_type]}",
+            self.image_description and f"  Visual: {self.image_description}",
+            f"\n  Caption:\n  {self.caption}",
+            self.hashtags and f"\n  Hashtags: {' '.join(self.hashtags)}",
+            self.voice_category and f"\n  Voice Style: {_VOICE_TITLE[self.voice_category]}",
+            self.scheduled_time
+            and f"  Scheduled: {self.scheduled_time.strftime(_SCHEDULED_FMT)}",
+            self.notes and f"  Notes: {self.notes}",
+            "  --- END DRAFT ---",
+            "\n  Tell me to edit it, or copy the caption to post on Instagram.",
+        )))
 
 
 class VoiceSample(BaseModel):
     """A sample of the artist's writing voice for RAG matching."""
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     id: Optional[str] = None
     text: str = Field(description="The sample text in the artist's voice")
     category: VoiceCategory = Field(description="Category of content")
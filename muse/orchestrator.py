@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Any, Optional
 
 from anthropic import Anthropic
 
@@ -23,6 +26,84 @@ Classify the user's message into exactly ONE category:
 
 Respond with ONLY the category name, nothing else."""
 
+_VALID_CATEGORIES = frozenset({"CALENDAR", "SOCIAL", "INVOICE", "EMAIL", "CRM", "GENERAL"})
+
+# The first three letters of each category are unique, so the router reply
+# can be resolved from a prefix without waiting for the whole word
+_CATEGORY_PREFIXES = {category[:3]: category for category in _VALID_CATEGORIES}
+
+# Words that settle the route on their own. A message whose keywords all
+# point at one category skips the router call; mixed or no hits still go
+# to the model. Words every agent deals with ("gig", "schedule", "contact")
+# are deliberately absent — they say nothing about which agent is meant.
+_KEYWORDS = {
+    "calendar": "CALENDAR",
+    "rehearsal": "CALENDAR",
+    "rehearsals": "CALENDAR",
+    "availability": "CALENDAR",
+    "instagram": "SOCIAL",
+    "tiktok": "SOCIAL",
+    "caption": "SOCIAL",
+    "captions": "SOCIAL",
+    "hashtag": "SOCIAL",
+    "hashtags": "SOCIAL",
+    "invoice": "INVOICE",
+    "invoices": "INVOICE",
+    "billing": "INVOICE",
+    "income": "INVOICE",
+    "inbox": "EMAIL",
+    "unread": "EMAIL",
+    "gmail": "EMAIL",
+    "contacts": "CRM",
+    "crm": "CRM",
+}
+
+# Words that point at another domain's action ("draft a reply", "post about
+# my gig"). Any of these in the message leaves the decision to the model.
+_COMPETING = frozenset({
+    "email", "emails", "reply", "replies", "draft", "drafts", "post", "posts",
+    "message", "messages", "send", "booking", "gig", "gigs", "schedule",
+    "contact", "pay", "paid",
+})
+
+_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(sorted({*_KEYWORDS, *_COMPETING}, key=len, reverse=True)) + r")\b"
+)
+
+
+def _keyword_category(message: str) -> str | None:
+    """Return the category every keyword in the message agrees on, if any."""
+    words = set(_KEYWORD_RE.findall(message.lower()))
+    if words & _COMPETING:
+        return None
+    categories = {_KEYWORDS[word] for word in words}
+    return categories.pop() if len(categories) == 1 else None
+
+
+# Reply for messages no agent handles — built once, returned as-is
+_FALLBACK_HELP = (
+    "Hey! I'm Muse, your AI manager. I can help you with:\n\n"
+    "📅 **Calendar** — schedule gigs, sessions, rehearsals, check availability\n"
+    "📧 **Email** — inbox triage, draft replies, extract gig details\n"
+    "💰 **Invoicing** — create invoices, generate PDFs, track payments\n"
+    "📱 **Social Media** — draft Instagram posts, voice-matched captions, hashtags\n"
+    "👥 **CRM** — manage contacts, log meeting notes, track relationships\n\n"
+    "What can I help you with?"
+)
+_GENERAL_FALLBACK = ("GENERAL", _FALLBACK_HELP)
+
+# Category → (module, class) of the agent that handles it, imported on first use
+_AGENT_SPECS: dict[str, tuple[str, str]] = {
+    "CALENDAR": ("muse.agents.calendar_agent", "CalendarAgent"),
+    "EMAIL": ("muse.agents.email_agent", "EmailAgent"),
+    "INVOICE": ("muse.agents.invoice_agent", "InvoiceAgent"),
+    "SOCIAL": ("muse.agents.social_agent", "SocialAgent"),
+    "CRM": ("muse.agents.crm_agent", "CRMAgent"),
+}
+
+# Attribute-style access kept for callers that used the old properties
+_AGENT_ATTRS = {f"{category.lower()}_agent": category for category in _AGENT_SPECS}
+
 
 class Orchestrator:
     """Routes user messages to the appropriate Muse agent.
@@ -34,68 +115,34 @@ class Orchestrator:
     def __init__(self, client: Anthropic | None = None):
         self.client = client or Anthropic(api_key=config.ANTHROPIC_API_KEY)
 
-        # Lazy-loaded agent instances
-        self._calendar_agent = None
-        self._email_agent = None
-        self._invoice_agent = None
-        self._social_agent = None
-        self._crm_agent = None
-
-    # ── Lazy Agent Properties ────────────────────────────────────────
-
-    @property
-    def calendar_agent(self):
-        if self._calendar_agent is None:
-            from muse.agents.calendar_agent import CalendarAgent
-            self._calendar_agent = CalendarAgent(client=self.client)
-            logger.info("[Orchestrator] Calendar agent initialized")
-        return self._calendar_agent
-
-    @property
-    def email_agent(self):
-        if self._email_agent is None:
-            from muse.agents.email_agent import EmailAgent
-            self._email_agent = EmailAgent(client=self.client)
-            logger.info("[Orchestrator] Email agent initialized")
-        return self._email_agent
-
-    @property
-    def invoice_agent(self):
-        if self._invoice_agent is None:
-            from muse.agents.invoice_agent import InvoiceAgent
-            self._invoice_agent = InvoiceAgent(client=self.client)
-            logger.info("[Orchestrator] Invoice agent initialized")
-        return self._invoice_agent
-
-    @property
-    def social_agent(self):
-        if self._social_agent is None:
-            from muse.agents.social_agent import SocialAgent
-            self._social_agent = SocialAgent(client=self.client)
-            logger.info("[Orchestrator] Social agent initialized")
-        return self._social_agent
-
-    @property
-    def crm_agent(self):
-        if self._crm_agent is None:
-            from muse.agents.crm_agent import CRMAgent
-            self._crm_agent = CRMAgent(client=self.client)
-            logger.info("[Orchestrator] CRM agent initialized")
-        return self._crm_agent
-
-    # ── Agent Map (resolves lazily) ──────────────────────────────────
+        # Lazy-loaded agent instances, keyed by router category
+        self._agents: dict[str, Any] = {}
+
+        # Router decisions per normalized message — repeats like "show inbox"
+        # skip the API round-trip. Per instance, since it closes over the client.
+        self._classify_cached = lru_cache(maxsize=512)(self._classify_uncached)
+
+    # ── Lazy Agents ──────────────────────────────────────────────────
+
+    def __getattr__(self, name: str):
+        """Expose agents as ``calendar_agent``, ``email_agent``, … on first access."""
+        category = _AGENT_ATTRS.get(name)
+        if category is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return self._get_agent(category)
 
     def _get_agent(self, category: str):
         """Get the agent for a category, initializing lazily."""
-        agent_map = {
-            "CALENDAR": lambda: self.calendar_agent,
-            "EMAIL": lambda: self.email_agent,
-            "INVOICE": lambda: self.invoice_agent,
-            "SOCIAL": lambda: self.social_agent,
-            "CRM": lambda: self.crm_agent,
-        }
-        getter = agent_map.get(category)
-        return getter() if getter else None
+        agent = self._agents.get(category)
+        if agent is None:
+            spec = _AGENT_SPECS.get(category)
+            if spec is None:
+                return None
+            module_path, class_name = spec
+            agent_cls = getattr(importlib.import_module(module_path), class_name)
+            agent = self._agents[category] = agent_cls(client=self.client)
+            logger.info(f"[Orchestrator] {class_name} initialized")
+        return agent
 
     # ── Routing ──────────────────────────────────────────────────────
 
@@ -113,37 +160,40 @@ class Orchestrator:
             return category, response
 
         # General / fallback
-        return "GENERAL", (
-            "Hey! I'm Muse, your AI manager. I can help you with:\n\n"
-            "📅 **Calendar** — schedule gigs, sessions, rehearsals, check availability\n"
-            "📧 **Email** — inbox triage, draft replies, extract gig details\n"
-            "💰 **Invoicing** — create invoices, generate PDFs, track payments\n"
-            "📱 **Social Media** — draft Instagram posts, voice-matched captions, hashtags\n"
-            "👥 **CRM** — manage contacts, log meeting notes, track relationships\n\n"
-            "What can I help you with?"
-        )
+        return _GENERAL_FALLBACK
 
     def _classify(self, message: str) -> str:
-        """Use Claude to classify the message intent."""
-        response = self.client.messages.create(
+        """Classify the message intent — by keyword when unambiguous, else via Claude.
+
+        Earlier router decisions are reused for the same text.
+        """
+        return _keyword_category(message) or self._classify_cached(message.strip().lower())
+
+    def _classify_uncached(self, message: str) -> str:
+        """Use Claude to classify the message intent.
+
+        Streams the reply and stops as soon as the first three letters
+        identify a category, instead of waiting for the full response.
+        """
+        reply = ""
+        with self.client.messages.stream(
             model=config.MODEL,
-            max_tokens=20,
+            max_tokens=3,
             system=ROUTER_PROMPT,
             messages=[{"role": "user", "content": message}],
-        )
-        category = response.content[0].text.strip().upper()
-
-        # Validate
-        valid = {"CALENDAR", "SOCIAL", "INVOICE", "EMAIL", "CRM", "GENERAL"}
-        if category not in valid:
-            logger.warning(f"[Orchestrator] Unexpected category '{category}', defaulting to GENERAL")
+        ) as stream:
+            for text in stream.text_stream:
+                reply += text
+                if len(reply.lstrip()) >= 3:
+                    break
+
+        category = _CATEGORY_PREFIXES.get(reply.lstrip()[:3].upper())
+        if category is None:
+            logger.warning(f"[Orchestrator] Unexpected category '{reply.strip()}', defaulting to GENERAL")
             return "GENERAL"
         return category
 
     def reset(self) -> None:
-        """Reset all agent conversation histories."""
-        for agent_attr in [self._calendar_agent, self._email_agent,
-                           self._invoice_agent, self._social_agent,
-                           self._crm_agent]:
-            if agent_attr is not None:
-                agent_attr.reset()
+        """Reset the conversation history of every agent loaded so far."""
+        for agent in self._agents.values():
+            agent.reset()
@@ -8,17 +8,157 @@ Claude can match their tone and style.
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+import time
 import uuid
+import weakref
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import chromadb
+import numpy as np
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+from muse._fastjson import dumps
 from muse.config import config
 from muse.utils.env import is_cloud
 
 logger = logging.getLogger(__name__)
 
+# Numba compiles the recency reranker when installed; NumPy runs it otherwise
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# How long the background writer waits to fill a batch
+_WRITE_WINDOW_S = 0.5
+
+
+# Index settings for a small (hundreds of samples) collection queried for
+# the top few matches. MiniLM vectors are unit length, so cosine ranks the
+# same as L2 and its distance maps straight onto 1 - similarity. Chroma only
+# applies these when it creates the collection; existing ones keep theirs,
+# so scores are derived from the space the collection actually uses.
+_HNSW_SETTINGS = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 8,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 32,
+    "hnsw:batch_size": 100,
+    "hnsw:sync_threshold": 1000,
+}
+
+
+# Recency reranking: candidates fetched per requested sample, and the age
+# (in days) over which a sample's recency bonus decays by a factor of e
+_RERANK_POOL = 4
+_RECENCY_DAYS = 30.0
+
+
+def _rerank(dists: np.ndarray, ages_days: np.ndarray, alpha: float) -> np.ndarray:
+    """Candidate indices, best first, by similarity blended with recency."""
+    scores = alpha * (1.0 - dists) + (1.0 - alpha) * np.exp(-ages_days / _RECENCY_DAYS)
+    return np.argsort(-scores)
+
+
+if NUMBA_AVAILABLE:
+    _rerank = njit(cache=True)(_rerank)
+
+
+def _distance_space(collection) -> str:
+    """The distance function a collection was created with: "l2", "cosine" or "ip"."""
+    try:
+        configuration = collection.configuration
+    except AttributeError:
+        # Older chromadb keeps it only in the collection metadata
+        return (collection.metadata or {}).get("hnsw:space", "l2")
+    index = configuration.get("hnsw") or configuration.get("spann") or {}
+    return index.get("space", "l2")
+
+
+def _age_days(created_at: str, now: datetime) -> float:
+    """Days since a created_at stamp; undated samples get no recency bonus."""
+    try:
+        return (now - datetime.fromisoformat(created_at)).total_seconds() / 86400
+    except (TypeError, ValueError):
+        return float("inf")
+
+
+def _preview(text: str) -> str:
+    """Short preview shown by list_samples, stored in each sample's metadata."""
+    return text[:80] + "..." if len(text) > 80 else text
+
+
+# Queue markers: _FLUSH (from flush()) writes what has been collected right
+# away; _STOP (from close() or the engine's finalizer) also ends the writer
+_FLUSH = object()
+_STOP = object()
+
+
+def _write_loop(
+    engine_ref: weakref.ref,
+    write_queue: queue.Queue,
+    collection,
+    embedder,
+    batch_size: int,
+) -> None:
+    """Background writer: batch queued samples into collection.add() calls.
+
+    Holds the engine only weakly, so an engine nobody references can be
+    collected; its finalizer then queues _STOP and the writer drains what
+    is left through the collection and embedder it was given.
+    """
+    while True:
+        batch = [write_queue.get()]
+        deadline = time.monotonic() + _WRITE_WINDOW_S
+        while batch[-1] is not _FLUSH and batch[-1] is not _STOP and len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(write_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        samples = [item for item in batch if item is not _FLUSH and item is not _STOP]
+        try:
+            if samples:
+                ids, documents, metadatas = (list(column) for column in zip(*samples))
+                collection.add(
+                    ids=ids,
+                    documents=documents,
+                    metadatas=metadatas,
+                    embeddings=embedder(documents),
+                )
+                engine = engine_ref()
+                if engine is not None:
+                    engine._query_cached.cache_clear()
+                logger.info(f"[VoiceEngine] Wrote {len(ids)} queued voice samples")
+        except Exception as e:
+            engine = engine_ref()
+            if engine is not None:
+                engine._adjust_count(-len(samples))
+            logger.error(f"[VoiceEngine] Failed to write {len(samples)} voice samples: {e}")
+        finally:
+            engine = None
+            for _ in batch:
+                write_queue.task_done()
+        if batch[-1] is _STOP:
+            return
+
+
+def _stop_writer(write_queue: queue.Queue, writer: threading.Thread) -> None:
+    """Queue _STOP and wait for the writer to drain everything before it."""
+    write_queue.put(_STOP)
+    # The last reference to an engine can be dropped on the writer itself
+    if threading.current_thread() is not writer:
+        writer.join()
+
 
 # Seed voice samples — representative of common musician post styles
 SEED_VOICE_SAMPLES = [
@@ -77,10 +217,25 @@ class VoiceEngine:
     for a given query using semantic similarity search.
     """
 
-    def __init__(self, persist_dir: str | None = None):
+    def __init__(self, persist_dir: str | None = None, batch_size: int = 200):
         self.persist_dir = persist_dir or config.CHROMADB_PATH
         self.collection_name = "artist_voice_samples"
 
+        # add_sample only enqueues; a background writer sends samples to
+        # Chroma in batches of up to batch_size (or whatever arrives within
+        # _WRITE_WINDOW_S). Every read flushes first so nothing is missed.
+        self.batch_size = batch_size
+        self._write_queue: queue.Queue = queue.Queue()
+
+        # Same MiniLM model as Chroma's default embedder, held for the
+        # engine's lifetime so the ONNX session loads once. Vectors are
+        # passed to Chroma explicitly; repeated query texts hit the cache.
+        self._embedder = ONNXMiniLM_L6_V2()
+        self._embed_query = lru_cache(maxsize=256)(self._embed_one)
+
+        # Search results per (query, n_results, category); cleared on writes
+        self._query_cached = lru_cache(maxsize=256)(self._query)
+
         # Initialize ChromaDB — in-memory on cloud, persistent locally
         if is_cloud():
             self.client = chromadb.Client()
@@ -95,17 +250,59 @@ class VoiceEngine:
 
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"description": "Artist voice samples for caption generation"},
+            metadata={
+                "description": "Artist voice samples for caption generation",
+                **_HNSW_SETTINGS,
+            },
         )
 
+        # Cosine similarity = 1 - distance * scale. Cosine and ip distances
+        # are already 1 - similarity; Chroma's l2 is squared Euclidean, which
+        # for unit vectors is 2 - 2 * similarity.
+        self._distance_scale = 0.5 if _distance_space(self.collection) == "l2" else 1.0
+
+        # The writer holds the engine weakly; the finalizer stops it when the
+        # engine is collected, on close(), or at interpreter exit, after the
+        # samples still queued have been written
+        self._writer = threading.Thread(
+            target=_write_loop,
+            args=(
+                weakref.ref(self), self._write_queue, self.collection,
+                self._embedder, batch_size,
+            ),
+            name="voice-engine-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        self._finalizer = weakref.finalize(
+            self, _stop_writer, self._write_queue, self._writer
+        )
+
+        # Sample total, kept in step with our own writes so reads don't pay
+        # for collection.count(); refresh_count() re-reads it from Chroma
+        self._count_lock = threading.Lock()
+        self._cached_count = self.collection.count()
+
         # Seed if empty
-        if self.collection.count() == 0:
+        if self._cached_count == 0:
             self._seed_samples()
 
         logger.info(
-            f"[VoiceEngine] Initialized with {self.collection.count()} voice samples"
+            f"[VoiceEngine] Initialized with {self._cached_count} voice samples"
         )
 
+        # Load the HNSW index and the ONNX session off the request path
+        threading.Thread(
+            target=self._warm_up, name="voice-engine-warmup", daemon=True
+        ).start()
+
+    def _warm_up(self) -> None:
+        """Run one throwaway query so the first real lookup isn't a cold one."""
+        try:
+            self.collection.query(query_embeddings=self._embed(["warmup"]), n_results=1)
+        except Exception as e:
+            logger.debug(f"[VoiceEngine] Warm-up query failed: {e}")
+
     def _seed_samples(self) -> None:
         """Seed the collection with representative voice samples."""
         logger.info("[VoiceEngine] Seeding voice samples...")
@@ -113,6 +310,7 @@ class VoiceEngine:
         ids = []
         documents = []
         metadatas = []
+        now = datetime.now().isoformat()
 
         for sample in SEED_VOICE_SAMPLES:
             sample_id = f"seed_{uuid.uuid4().hex[:8]}"
@@ -121,16 +319,27 @@ class VoiceEngine:
             metadatas.append({
                 "category": sample["category"],
                 "source": sample["source"],
-                "created_at": datetime.now().isoformat(),
+                "created_at": now,
+                "preview": _preview(sample["text"]),
             })
 
         self.collection.add(
             ids=ids,
             documents=documents,
             metadatas=metadatas,
+            embeddings=self._embed(documents),
         )
+        self._adjust_count(len(ids))
         logger.info(f"[VoiceEngine] Seeded {len(ids)} voice samples")
 
+    def _embed(self, documents: list[str]) -> list:
+        """Embed a batch of texts in one model call."""
+        return self._embedder(documents)
+
+    def _embed_one(self, text: str):
+        """Embed a single text (wrapped in an LRU cache for queries)."""
+        return self._embedder([text])[0]
+
     def add_sample(
         self,
         text: str,
@@ -139,6 +348,9 @@ class VoiceEngine:
     ) -> dict:
         """Add a new voice sample to the collection.
 
+        Returns as soon as the sample is queued; the background writer adds
+        it with the next batch, and any read from this engine flushes first.
+
         Args:
             text: The sample text in the artist's voice.
             category: Voice category (gig_promo, behind_the_scenes, etc.).
@@ -149,105 +361,228 @@ class VoiceEngine:
         """
         sample_id = f"voice_{uuid.uuid4().hex[:8]}"
 
-        self.collection.add(
-            ids=[sample_id],
-            documents=[text],
-            metadatas=[{
-                "category": category,
-                "source": source,
-                "created_at": datetime.now().isoformat(),
-            }],
-        )
+        # Counted on enqueue; the writer takes it back if the add fails
+        self._adjust_count(1)
+        self._write_queue.put((sample_id, text, {
+            "category": category,
+            "source": source,
+            "created_at": datetime.now().isoformat(),
+            "preview": _preview(text),
+        }))
 
         logger.info(f"[VoiceEngine] Added voice sample {sample_id} ({category})")
         return {
             "id": sample_id,
             "category": category,
             "text_preview": text[:100] + "..." if len(text) > 100 else text,
-            "total_samples": self.collection.count(),
+            "total_samples": self.sample_count(),
         }
 
+    def add_samples(self, samples: list[dict], batch_size: int | None = None) -> dict:
+        """Add many voice samples, one collection.add() per batch.
+
+        Args:
+            samples: Dicts with "text" and optional "category"/"source".
+            batch_size: Samples per add() call. Defaults to the engine's.
+
+        Returns:
+            Dict with the new sample IDs and the collection size.
+        """
+        self.flush()
+        batch_size = batch_size or self.batch_size
+        now = datetime.now().isoformat()
+
+        ids = [f"voice_{uuid.uuid4().hex[:8]}" for _ in samples]
+        documents = [sample["text"] for sample in samples]
+        metadatas = [
+            {
+                "category": sample.get("category", "other"),
+                "source": sample.get("source", "imported"),
+                "created_at": now,
+                "preview": _preview(sample["text"]),
+            }
+            for sample in samples
+        ]
+
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            self.collection.add(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+                embeddings=self._embed(documents[start:end]),
+            )
+            self._adjust_count(len(ids[start:end]))
+        self._query_cached.cache_clear()
+
+        logger.info(f"[VoiceEngine] Added {len(ids)} voice samples")
+        return {
+            "ids": ids,
+            "added": len(ids),
+            "total_samples": self.sample_count(),
+        }
+
+    def flush(self) -> None:
+        """Block until every queued add_sample() has been written."""
+        if not self._write_queue.unfinished_tasks or not self._writer.is_alive():
+            return
+        # The marker cuts the writer's batching window short
+        self._write_queue.put(_FLUSH)
+        self._write_queue.join()
+
+    def close(self) -> None:
+        """Write any queued samples and stop the background writer.
+
+        Safe to call more than once; add_sample() must not be used afterwards.
+        """
+        self._finalizer()
+
     def get_voice_context(
         self,
         query: str,
         n_results: int = 3,
         category: str | None = None,
-    ) -> dict:
+        recency_weight: float = 0.0,
+        serialize: bool = False,
+    ) -> dict | bytes:
         """Retrieve voice samples most relevant to a query.
 
         Args:
             query: The topic or context for the post being created.
             n_results: Number of samples to return.
             category: Optional category filter.
+            recency_weight: 0-1 share of the ranking given to how recently a
+                sample was added; 0 ranks by similarity alone.
+            serialize: Return the payload as JSON bytes instead of a dict.
 
         Returns:
             Dict with matching voice samples for Claude to reference.
         """
+        self.flush()
+        if recency_weight > 0:
+            matches = self._query_cached(query, n_results * _RERANK_POOL, category)
+            matches = self._rerank_by_recency(matches, recency_weight)[:n_results]
+        else:
+            matches = self._query_cached(query, n_results, category)
+
+        samples = [
+            {"text": text, "category": sample_category, "relevance_score": score}
+            for text, sample_category, score, _ in matches
+        ]
+
+        payload = {
+            "query": query,
+            "samples_found": len(samples),
+            "voice_samples": samples,
+            "instruction": (
+                "Use these samples as reference for the artist's tone and style. "
+                "Match their voice — their energy, vocabulary, and personality — "
+                "but create original content. Don't copy the samples directly."
+            ),
+        }
+        return dumps(payload) if serialize else payload
+
+    @staticmethod
+    def _rerank_by_recency(matches: tuple, recency_weight: float) -> list:
+        """Reorder query matches by similarity blended with sample age."""
+        if not matches:
+            return []
+        now = datetime.now()
+        dists = np.array([1 - score for _, _, score, _ in matches], dtype=np.float64)
+        ages = np.array(
+            [_age_days(created_at, now) for _, _, _, created_at in matches],
+            dtype=np.float64,
+        )
+        order = _rerank(dists, ages, 1.0 - min(recency_weight, 1.0))
+        return [matches[i] for i in order.tolist()]
+
+    def _query(self, query: str, n_results: int, category: str | None) -> tuple:
+        """Run the similarity search; returns (text, category, score, created_at) tuples.
+
+        Wrapped in a per-instance LRU cache that is cleared on every write.
+        """
         where_filter = {"category": category} if category else None
 
         # Ensure we don't request more than we have
-        available = self.collection.count()
+        available = self._cached_count
         n_results = min(n_results, available) if available > 0 else 1
+        query_embedding = self._embed_query(query)
 
         try:
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[query_embedding],
                 n_results=n_results,
                 where=where_filter,
             )
         except Exception as e:
             logger.warning(f"[VoiceEngine] Query failed with filter, retrying without: {e}")
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[query_embedding],
                 n_results=n_results,
             )
 
-        samples = []
+        matches = []
         if results and results["documents"] and results["documents"][0]:
             for i, doc in enumerate(results["documents"][0]):
                 metadata = results["metadatas"][0][i] if results["metadatas"] else {}
                 distance = results["distances"][0][i] if results["distances"] else None
-                samples.append({
-                    "text": doc,
-                    "category": metadata.get("category", "unknown"),
-                    "relevance_score": round(1 - (distance or 0), 3),
-                })
-
-        return {
-            "query": query,
-            "samples_found": len(samples),
-            "voice_samples": samples,
-            "instruction": (
-                "Use these samples as reference for the artist's tone and style. "
-                "Match their voice — their energy, vocabulary, and personality — "
-                "but create original content. Don't copy the samples directly."
-            ),
-        }
-
-    def list_samples(self) -> dict:
+                matches.append((
+                    doc,
+                    metadata.get("category", "unknown"),
+                    round(1 - (distance or 0) * self._distance_scale, 3),
+                    metadata.get("created_at", ""),
+                ))
+        return tuple(matches)
+
+    def list_samples(self, serialize: bool = False) -> dict | bytes:
         """List all voice samples in the collection.
 
+        Args:
+            serialize: Return the payload as JSON bytes instead of a dict.
+
         Returns:
             Dict with all samples and their metadata.
         """
-        results = self.collection.get()
-
-        samples = []
-        if results and results["documents"]:
-            for i, doc in enumerate(results["documents"]):
-                metadata = results["metadatas"][i] if results["metadatas"] else {}
-                samples.append({
-                    "id": results["ids"][i],
-                    "text_preview": doc[:80] + "..." if len(doc) > 80 else doc,
-                    "category": metadata.get("category", "unknown"),
-                    "source": metadata.get("source", "unknown"),
-                    "created_at": metadata.get("created_at", ""),
-                })
+        self.flush()
+        # Metadata only — the preview lives there, so document bodies stay put
+        results = self.collection.get(include=["metadatas"])
+        ids = results["ids"] if results else []
+        metadatas = (results["metadatas"] if results else None) or [{}] * len(ids)
+
+        # Samples stored before previews existed get one filled in once
+        missing = [sample_id for sample_id, meta in zip(ids, metadatas) if "preview" not in meta]
+        if missing:
+            filled = self._backfill_previews(missing)
+            metadatas = [
+                filled.get(sample_id, meta) for sample_id, meta in zip(ids, metadatas)
+            ]
+
+        samples = [
+            {
+                "id": sample_id,
+                "text_preview": metadata.get("preview", ""),
+                "category": metadata.get("category", "unknown"),
+                "source": metadata.get("source", "unknown"),
+                "created_at": metadata.get("created_at", ""),
+            }
+            for sample_id, metadata in zip(ids, metadatas)
+        ]
 
-        return {
+        payload = {
             "total_samples": len(samples),
             "samples": samples,
         }
+        return dumps(payload) if serialize else payload
+
+    def _backfill_previews(self, sample_ids: list[str]) -> dict[str, dict]:
+        """Store a preview in the metadata of older samples; returns id → new metadata."""
+        results = self.collection.get(ids=sample_ids, include=["documents", "metadatas"])
+        metadatas = [
+            {**(meta or {}), "preview": _preview(doc)}
+            for doc, meta in zip(results["documents"], results["metadatas"])
+        ]
+        self.collection.update(ids=results["ids"], metadatas=metadatas)
+        return dict(zip(results["ids"], metadatas))
 
     def delete_sample(self, sample_id: str) -> dict:
         """Remove a voice sample from the collection.
@@ -259,16 +594,32 @@ class VoiceEngine:
             Dict with confirmation.
         """
         try:
+            self.flush()
+            # Chroma ignores unknown IDs, so only count what is really there
+            found = len(self.collection.get(ids=[sample_id], include=[])["ids"])
             self.collection.delete(ids=[sample_id])
+            self._adjust_count(-found)
+            self._query_cached.cache_clear()
             logger.info(f"[VoiceEngine] Deleted voice sample {sample_id}")
             return {
                 "deleted": sample_id,
-                "remaining_samples": self.collection.count(),
+                "remaining_samples": self.sample_count(),
             }
         except Exception as e:
             logger.error(f"[VoiceEngine] Error deleting sample {sample_id}: {e}")
             return {"error": f"Could not delete sample {sample_id}: {str(e)}"}
 
     def sample_count(self) -> int:
-        """Return total number of voice samples."""
-        return self.collection.count()
+        """Return total number of voice samples, including queued ones."""
+        return self._cached_count
+
+    def refresh_count(self) -> int:
+        """Re-read the sample total from Chroma, e.g. after outside writes."""
+        self.flush()
+        with self._count_lock:
+            self._cached_count = self.collection.count()
+        return self._cached_count
+
+    def _adjust_count(self, delta: int) -> None:
+        with self._count_lock:
+            self._cached_count += delta
@@ -11,8 +11,10 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from muse.config import config
@@ -29,6 +31,173 @@ except ImportError:
     GOOGLE_AVAILABLE = False
     logger.info("Google API libraries not installed — using local calendar")
 
+# NumPy (installed with chromadb) vectorizes the gap scan in find_availability
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# ciso8601 is an optional C parser for the event timestamps
+try:
+    from ciso8601 import parse_datetime
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing "Z" for UTC.
+
+    Cached: the same event times come back on every list/availability call.
+    """
+    if CISO8601_AVAILABLE:
+        return parse_datetime(value)  # handles "Z" itself
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _free_gaps(
+    window_start: datetime,
+    window_end: datetime,
+    starts: list[datetime],
+    ends: list[datetime],
+    duration: timedelta,
+) -> list[tuple[datetime, datetime]]:
+    """(start, end) of every gap of at least `duration` between sorted events."""
+    if NUMPY_AVAILABLE and starts:
+        return _free_gaps_numpy(window_start, window_end, starts, ends, duration)
+
+    gaps = []
+    current = window_start
+    for event_start, event_end in zip(starts, ends):
+        if event_start > current and event_start - current >= duration:
+            gaps.append((current, event_start))
+        if event_end > current:
+            current = event_end
+    if window_end > current and window_end - current >= duration:
+        gaps.append((current, window_end))
+    return gaps
+
+
+def _free_gaps_numpy(
+    window_start: datetime,
+    window_end: datetime,
+    starts: list[datetime],
+    ends: list[datetime],
+    duration: timedelta,
+) -> list[tuple[datetime, datetime]]:
+    """Vectorized _free_gaps: same slots, same datetime objects, no Python loop."""
+    usec = timedelta(microseconds=1)
+    start_us = np.array([(dt - window_start) // usec for dt in starts], dtype=np.int64)
+    end_us = np.array([(dt - window_start) // usec for dt in ends], dtype=np.int64)
+    need_us = duration // usec
+
+    # Position 0 stands for the window start; position i + 1 for event i's end
+    reach = np.concatenate(([0], end_us))
+    latest = np.maximum.accumulate(reach)
+    # Which position set the running maximum — ties keep the earliest, as
+    # the sequential scan only advances on a strictly later end
+    is_record = np.concatenate(([True], reach[1:] > latest[:-1]))
+    holder = np.maximum.accumulate(np.where(is_record, np.arange(len(reach)), 0))
+
+    # Event i's gap opens at the latest end among positions 0..i
+    gap = start_us - latest[:-1]
+    hits = np.flatnonzero((gap > 0) & (gap >= need_us))
+
+    anchors = [window_start, *ends]
+    gaps = [(anchors[holder[i]], starts[i]) for i in hits.tolist()]
+
+    current = anchors[holder[-1]]
+    if window_end > current and window_end - current >= duration:
+        gaps.append((current, window_end))
+    return gaps
+
+
+# Columns update_event may set. Keys end up in the SQL text, so nothing
+# outside this set is accepted.
+_UPDATABLE_COLUMNS = frozenset({
+    "title", "event_type", "venue", "address", "start_time", "end_time",
+    "load_in_time", "soundcheck_time", "set_time", "pay", "pay_notes",
+    "contact_name", "contact_info", "gear_notes", "status", "notes",
+})
+
+
+_INSERT_EVENT_SQL = """INSERT INTO events
+    (id, title, event_type, venue, address, start_time, end_time,
+     load_in_time, soundcheck_time, set_time, pay, pay_notes,
+     contact_name, contact_info, gear_notes, status, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _insert_params(event: GigEvent, event_id: str) -> tuple:
+    """Row values for _INSERT_EVENT_SQL."""
+    return (
+        event_id,
+        event.title,
+        event.event_type.value,
+        event.venue,
+        event.address,
+        event.start_time.isoformat(),
+        event.end_time.isoformat(),
+        event.load_in_time.isoformat() if event.load_in_time else None,
+        event.soundcheck_time.isoformat() if event.soundcheck_time else None,
+        event.set_time.isoformat() if event.set_time else None,
+        event.pay,
+        event.pay_notes,
+        event.contact_name,
+        event.contact_info,
+        event.gear_notes,
+        event.status.value,
+        event.notes,
+    )
+
+
+@lru_cache(maxsize=64)
+def _update_sql(columns: tuple[str, ...]) -> str:
+    """UPDATE statement for one sorted set of columns, built once per shape."""
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE events SET {assignments} WHERE id = ?"
+
+
+# events.list paging: the API's largest page, and a partial response
+# limited to what _google_list reads
+_GOOGLE_PAGE_SIZE = 2500
+_GOOGLE_LIST_FIELDS = (
+    "nextPageToken,"
+    "items(id,summary,location,description,status,start,end)"
+)
+
+
+def _unknown_fields_error(columns: tuple[str, ...]) -> str:
+    unknown = [column for column in columns if column not in _UPDATABLE_COLUMNS]
+    return f"Unknown event fields: {', '.join(unknown)}"
+
+
+def _event_record(event: GigEvent, event_id: str) -> dict:
+    """The created event as a plain dict with its new ID.
+
+    GigEvent is flat (no nested models), so a copy of its field values is
+    what model_dump() would build, without the serializer walk.
+    """
+    return {**vars(event), "id": event_id}
+
+
+def _conflict_entry(event) -> dict:
+    """Conflict record for an event dict or events-table row."""
+    return {
+        "event_id": event["id"],
+        "title": event["title"],
+        "start_time": event["start_time"],
+        "end_time": event["end_time"],
+        "venue": event["venue"] or "",
+        "overlap_type": "full_or_partial",
+    }
+
 
 class CalendarTools:
     """Wraps Google Calendar API (or local fallback) for the Calendar Agent."""
@@ -68,8 +237,21 @@ class CalendarTools:
     # ── Local SQLite Fallback ───────────────────────────────────────
 
     def _init_local_db(self) -> None:
-        """Initialize local SQLite database for development/demo mode."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        """Initialize local SQLite database for development/demo mode.
+
+        Opens one autocommit connection for the lifetime of this instance;
+        the lock serializes tools that run on the agent's thread pool.
+        """
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS events (
                 id TEXT PRIMARY KEY,
@@ -91,8 +273,14 @@ class CalendarTools:
                 notes TEXT DEFAULT ''
             )
         """)
-        conn.commit()
-        conn.close()
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_range ON events(start_time, end_time, event_type)"
+        )
+        # Type-filtered listings seek straight to one type's time range
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_type_time"
+            " ON events(event_type, start_time, end_time)"
+        )
         logger.info(f"Local calendar initialized at {self.db_path}")
 
     # ── Tool Implementations ────────────────────────────────────────
@@ -103,6 +291,13 @@ class CalendarTools:
             return self._local_create(event)
         return self._google_create(event)
 
+    def bulk_create(self, events: list[GigEvent]) -> dict:
+        """Create many events at once, e.g. importing a tour schedule."""
+        if self.use_local:
+            return self._local_bulk_create(events)
+        created = [self._google_create(event)["event"] for event in events]
+        return {"status": "created", "count": len(created), "events": created}
+
     def list_events(
         self,
         start_date: str,
@@ -120,6 +315,14 @@ class CalendarTools:
             return self._local_update(event_id, updates)
         return self._google_update(event_id, updates)
 
+    def bulk_update(self, changes: list[tuple[str, dict]]) -> dict:
+        """Apply many (event_id, updates) pairs, e.g. cancelling a whole tour."""
+        if self.use_local:
+            return self._local_bulk_update(changes)
+        for event_id, updates in changes:
+            self._google_update(event_id, updates)
+        return {"status": "updated", "count": len(changes)}
+
     def delete_event(self, event_id: str) -> dict:
         """Delete/cancel an event by ID."""
         if self.use_local:
@@ -128,20 +331,13 @@ class CalendarTools:
 
     def check_conflicts(self, start_time: str, end_time: str) -> list[dict]:
         """Check for scheduling conflicts in a time range."""
-        events = self.list_events(start_time, end_time)
-        conflicts = []
-        for event in events:
-            if event.get("status") == "cancelled":
-                continue
-            conflicts.append({
-                "event_id": event["id"],
-                "title": event["title"],
-                "start_time": event["start_time"],
-                "end_time": event["end_time"],
-                "venue": event.get("venue", ""),
-                "overlap_type": "full_or_partial",
-            })
-        return conflicts
+        if self.use_local:
+            return self._local_check_conflicts(start_time, end_time)
+        return [
+            _conflict_entry(event)
+            for event in self._google_list(start_time, end_time)
+            if event.get("status") != "cancelled"
+        ]
 
     def find_availability(
         self,
@@ -155,92 +351,55 @@ class CalendarTools:
         """
         events = self.list_events(search_start, search_end)
 
-        start_dt = datetime.fromisoformat(search_start.replace("Z", "+00:00"))
-        end_dt = datetime.fromisoformat(search_end.replace("Z", "+00:00"))
+        start_dt = _parse_iso(search_start)
+        end_dt = _parse_iso(search_end)
         duration = timedelta(hours=duration_hours)
 
-        # Sort events by start time
+        # Sort events by start time and parse each timestamp once
         sorted_events = sorted(events, key=lambda e: e["start_time"])
-
-        # Find gaps between events
-        available = []
-        current = start_dt
-
-        for event in sorted_events:
-            event_start = datetime.fromisoformat(
-                event["start_time"].replace("Z", "+00:00")
-            )
-            event_end = datetime.fromisoformat(
-                event["end_time"].replace("Z", "+00:00")
-            )
-
-            if event_start > current:
-                gap = event_start - current
-                if gap >= duration:
-                    available.append({
-                        "start": current.isoformat(),
-                        "end": event_start.isoformat(),
-                        "duration_hours": gap.total_seconds() / 3600,
-                    })
-
-            if event_end > current:
-                current = event_end
-
-        # Check remaining time after last event
-        if end_dt > current and (end_dt - current) >= duration:
-            available.append({
-                "start": current.isoformat(),
-                "end": end_dt.isoformat(),
-                "duration_hours": (end_dt - current).total_seconds() / 3600,
-            })
-
-        return available
+        starts = [_parse_iso(e["start_time"]) for e in sorted_events]
+        ends = [_parse_iso(e["end_time"]) for e in sorted_events]
+
+        return [
+            {
+                "start": gap_start.isoformat(),
+                "end": gap_end.isoformat(),
+                "duration_hours": (gap_end - gap_start).total_seconds() / 3600,
+            }
+            for gap_start, gap_end in _free_gaps(start_dt, end_dt, starts, ends, duration)
+        ]
 
     # ── Local SQLite Implementations ────────────────────────────────
 
     def _local_create(self, event: GigEvent) -> dict:
         event_id = f"local_{uuid.uuid4().hex[:12]}"
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute(
-            """INSERT INTO events 
-            (id, title, event_type, venue, address, start_time, end_time,
-             load_in_time, soundcheck_time, set_time, pay, pay_notes,
-             contact_name, contact_info, gear_notes, status, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                event_id,
-                event.title,
-                event.event_type.value,
-                event.venue,
-                event.address,
-                event.start_time.isoformat(),
-                event.end_time.isoformat(),
-                event.load_in_time.isoformat() if event.load_in_time else None,
-                event.soundcheck_time.isoformat() if event.soundcheck_time else None,
-                event.set_time.isoformat() if event.set_time else None,
-                event.pay,
-                event.pay_notes,
-                event.contact_name,
-                event.contact_info,
-                event.gear_notes,
-                event.status.value,
-                event.notes,
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_INSERT_EVENT_SQL, _insert_params(event, event_id))
+
+        return {"status": "created", "event": _event_record(event, event_id)}
+
+    def _local_bulk_create(self, events: list[GigEvent]) -> dict:
+        # One executemany in one transaction instead of a commit per event
+        event_ids = [f"local_{uuid.uuid4().hex[:12]}" for _ in events]
+        rows = [_insert_params(event, event_id) for event, event_id in zip(events, event_ids)]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_INSERT_EVENT_SQL, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
-        result = event.model_dump()
-        result["id"] = event_id
-        return {"status": "created", "event": result}
+        created = [_event_record(event, event_id) for event, event_id in zip(events, event_ids)]
+        return {"status": "created", "count": len(created), "events": created}
 
     def _local_list(
         self, start_date: str, end_date: str, event_type: str | None = None
     ) -> list[dict]:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-
-        query = "SELECT * FROM events WHERE start_time >= ? AND start_time <= ?"
+        # Anything overlapping the window, including events already under way
+        query = "SELECT * FROM events WHERE end_time >= ? AND start_time <= ?"
         params: list = [start_date, end_date]
 
         if event_type:
@@ -248,32 +407,57 @@ class CalendarTools:
             params.append(event_type)
 
         query += " ORDER BY start_time"
-        rows = conn.execute(query, params).fetchall()
-        conn.close()
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
 
         return [dict(row) for row in rows]
 
+    def _local_check_conflicts(self, start_time: str, end_time: str) -> list[dict]:
+        # Overlap and status filters both run in SQL on the range index
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT id, title, start_time, end_time, venue FROM events
+                WHERE end_time > ? AND start_time < ? AND status != 'cancelled'
+                ORDER BY start_time""",
+                (start_time, end_time),
+            ).fetchall()
+        return [_conflict_entry(row) for row in rows]
+
     def _local_update(self, event_id: str, updates: dict) -> dict:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        set_clauses = []
-        params = []
-        for key, value in updates.items():
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
-        params.append(event_id)
+        columns = tuple(sorted(updates))
+        if not _UPDATABLE_COLUMNS.issuperset(columns):
+            return {"error": _unknown_fields_error(columns)}
 
-        conn.execute(
-            f"UPDATE events SET {', '.join(set_clauses)} WHERE id = ?", params
-        )
-        conn.commit()
-        conn.close()
+        params = [*(updates[column] for column in columns), event_id]
+        with self._lock:
+            self._conn.execute(_update_sql(columns), params)
         return {"status": "updated", "event_id": event_id, "updates": updates}
 
+    def _local_bulk_update(self, changes: list[tuple[str, dict]]) -> dict:
+        # One executemany per distinct set of columns, all in one transaction
+        groups: dict[tuple[str, ...], list[list]] = {}
+        for event_id, updates in changes:
+            columns = tuple(sorted(updates))
+            if not _UPDATABLE_COLUMNS.issuperset(columns):
+                return {"error": _unknown_fields_error(columns)}
+            groups.setdefault(columns, []).append([*(updates[c] for c in columns), event_id])
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for columns, rows in groups.items():
+                    self._conn.executemany(_update_sql(columns), rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return {"status": "updated", "count": len(changes)}
+
     def _local_delete(self, event_id: str) -> dict:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute("UPDATE events SET status = 'cancelled' WHERE id = ?", (event_id,))
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE events SET status = 'cancelled' WHERE id = ?", (event_id,)
+            )
         return {"status": "cancelled", "event_id": event_id}
 
     # ── Google Calendar Implementations ─────────────────────────────
@@ -296,8 +480,7 @@ class CalendarTools:
 
         created = self.service.events().insert(calendarId="primary", body=body).execute()
 
-        result = event.model_dump()
-        result["id"] = created["id"]
+        result = _event_record(event, created["id"])
         return {"status": "created", "event": result, "google_link": created.get("htmlLink")}
 
     def _google_list(
@@ -309,31 +492,37 @@ class CalendarTools:
         if not end_date.endswith("Z") and "+" not in end_date:
             end_date += "T23:59:59Z" if "T" not in end_date else "Z"
 
-        results = (
-            self.service.events()
-            .list(
-                calendarId="primary",
-                timeMin=start_date,
-                timeMax=end_date,
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
+        # Page through the whole range — Google stops at 250 events per
+        # response by default. Each page token comes from the previous
+        # response, so pages are fetched in order, at the API maximum size
+        # and with only the fields we read to keep round trips down.
+        api = self.service.events()
+        request = api.list(
+            calendarId="primary",
+            timeMin=start_date,
+            timeMax=end_date,
+            singleEvents=True,
+            orderBy="startTime",
+            maxResults=_GOOGLE_PAGE_SIZE,
+            fields=_GOOGLE_LIST_FIELDS,
         )
 
         events = []
-        for item in results.get("items", []):
-            start = item["start"].get("dateTime", item["start"].get("date", ""))
-            end = item["end"].get("dateTime", item["end"].get("date", ""))
-            events.append({
-                "id": item["id"],
-                "title": item.get("summary", "Untitled"),
-                "start_time": start,
-                "end_time": end,
-                "venue": item.get("location", ""),
-                "description": item.get("description", ""),
-                "status": item.get("status", "confirmed"),
-            })
+        while request is not None:
+            results = request.execute()
+            for item in results.get("items", []):
+                start = item["start"].get("dateTime", item["start"].get("date", ""))
+                end = item["end"].get("dateTime", item["end"].get("date", ""))
+                events.append({
+                    "id": item["id"],
+                    "title": item.get("summary", "Untitled"),
+                    "start_time": start,
+                    "end_time": end,
+                    "venue": item.get("location", ""),
+                    "description": item.get("description", ""),
+                    "status": item.get("status", "confirmed"),
+                })
+            request = api.list_next(request, results)
 
         return events
 
@@ -9,8 +9,10 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import threading
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from muse.config import config
@@ -24,19 +26,104 @@ from muse.models.contacts import (
 
 logger = logging.getLogger(__name__)
 
+# Columns covered by the contacts full-text index (what `query` searches)
+_FTS_COLUMNS = ("organization_name", "contact_person", "email")
+
+# Seed rows are written column-for-column from these tuples
+_SEED_CONTACT_COLUMNS = (
+    "id", "organization_name", "contact_person", "email", "phone", "role", "tags",
+    "notes", "typical_rate", "payment_terms", "preferred_payment",
+    "relationship_status", "first_contact_date", "last_contact_date",
+    "last_invoice_id", "upcoming_event_id", "created_at", "updated_at",
+)
+_SEED_INTERACTION_COLUMNS = (
+    "id", "contact_id", "interaction_type", "content", "interaction_date",
+    "follow_up_date", "created_at",
+)
+_SEED_CONTACT_SQL = (
+    f"INSERT OR IGNORE INTO contacts ({', '.join(_SEED_CONTACT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_SEED_CONTACT_COLUMNS))})"
+)
+_SEED_INTERACTION_SQL = (
+    f"INSERT OR IGNORE INTO interactions ({', '.join(_SEED_INTERACTION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_SEED_INTERACTION_COLUMNS))})"
+)
+
+_CONTACT_INSERT_SQL = """INSERT INTO contacts
+    (id, organization_name, contact_person, email, phone, role, tags,
+     notes, typical_rate, payment_terms, preferred_payment,
+     relationship_status, first_contact_date, last_contact_date,
+     created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INTERACTION_INSERT_SQL = """INSERT INTO interactions
+    (id, contact_id, interaction_type, content, interaction_date,
+     follow_up_date, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+# Fields update_contact may set. Keys end up in the SQL text, so anything
+# else is dropped before the statement is built.
+_UPDATABLE_CONTACT_FIELDS = frozenset({
+    "organization_name", "contact_person", "email", "phone",
+    "role", "tags", "notes", "typical_rate", "payment_terms",
+    "preferred_payment", "relationship_status",
+    "last_invoice_id", "upcoming_event_id",
+})
+
+# Bumps a contact's last-contact date when an interaction is logged
+_TOUCH_CONTACT_SQL = """UPDATE contacts
+    SET last_contact_date = MAX(COALESCE(last_contact_date, ''), ?), updated_at = ?
+    WHERE id = ?"""
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@lru_cache(maxsize=64)
+def _update_contact_sql(fields: tuple[str, ...]) -> str:
+    """UPDATE statement for one sorted set of fields, built once per shape."""
+    assignments = ", ".join(f"{field} = ?" for field in fields)
+    return f"UPDATE contacts SET {assignments}, updated_at = ? WHERE id = ?"
+
+
+@lru_cache(maxsize=512)
+def _parse_tags(raw: str) -> tuple[str, ...]:
+    """Decode a contact's JSON tags column.
+
+    Cached on the raw text, so a changed tag list is simply a new key and
+    nothing needs invalidating. Returns a tuple so cached values can't be
+    mutated by callers.
+    """
+    return tuple(json.loads(raw))
+
 
 class CRMTools:
     """Handles contact and interaction CRUD for the CRM Agent."""
 
     def __init__(self):
         self.db_path = config.DB_PATH
+        self._fts_enabled = False
         self._init_db()
 
     # ── Database Setup ──────────────────────────────────────────────
 
     def _init_db(self) -> None:
-        """Initialize SQLite tables for contacts and interactions."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        """Initialize SQLite tables for contacts and interactions.
+
+        Opens one autocommit connection for the lifetime of this instance;
+        the lock serializes tools that run on the agent's thread pool.
+        """
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS contacts (
                 id TEXT PRIMARY KEY,
@@ -55,6 +142,7 @@ class CRMTools:
                 last_contact_date TEXT,
                 last_invoice_id TEXT DEFAULT '',
                 upcoming_event_id TEXT DEFAULT '',
+                interaction_count INTEGER NOT NULL DEFAULT 0,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL
             )
@@ -71,19 +159,141 @@ class CRMTools:
                 FOREIGN KEY(contact_id) REFERENCES contacts(id)
             )
         """)
-        conn.commit()
-        conn.close()
+        self._migrate_summary_columns(conn)
+
+        # Faceted search: role + status filters (already in last-contact
+        # order), and tags normalized into their own table so a tag filter
+        # is an index seek, not a LIKE scan
+        conn.executescript("""
+            DROP INDEX IF EXISTS idx_contacts_role_status;
+            CREATE INDEX IF NOT EXISTS idx_contacts_role_status_date
+                ON contacts(role, relationship_status, last_contact_date DESC);
+
+            -- Per-contact interaction history, newest first, and the
+            -- (sparse) follow-up dates read by get_contact_summary
+            CREATE INDEX IF NOT EXISTS idx_interactions_contact_date
+                ON interactions(contact_id, interaction_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_interactions_followup
+                ON interactions(contact_id, follow_up_date)
+                WHERE follow_up_date IS NOT NULL;
+
+            CREATE TABLE IF NOT EXISTS contact_tags (
+                contact_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (contact_id, tag)
+            );
+            CREATE INDEX IF NOT EXISTS idx_contact_tags_tag
+                ON contact_tags(tag, contact_id);
+
+            CREATE TRIGGER IF NOT EXISTS contact_tags_ai AFTER INSERT ON contacts
+            WHEN json_valid(new.tags) BEGIN
+                INSERT OR IGNORE INTO contact_tags (contact_id, tag)
+                SELECT new.id, lower(value) FROM json_each(new.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS contact_tags_au AFTER UPDATE OF tags ON contacts BEGIN
+                DELETE FROM contact_tags WHERE contact_id = old.id;
+                INSERT OR IGNORE INTO contact_tags (contact_id, tag)
+                SELECT new.id, lower(value) FROM json_each(new.tags)
+                WHERE json_valid(new.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS contact_tags_ad AFTER DELETE ON contacts BEGIN
+                DELETE FROM contact_tags WHERE contact_id = old.id;
+            END;
+
+            -- Backfill contacts created before the tag table existed
+            INSERT OR IGNORE INTO contact_tags (contact_id, tag)
+            SELECT c.id, lower(j.value)
+            FROM contacts c, json_each(c.tags) j
+            WHERE json_valid(c.tags)
+              AND NOT EXISTS (SELECT 1 FROM contact_tags t WHERE t.contact_id = c.id);
+        """)
+        self._fts_enabled = self._init_fts(conn)
         self._seed_sample_data()
         logger.info(f"CRM database initialized at {self.db_path}")
 
+    def _migrate_summary_columns(self, conn: sqlite3.Connection) -> None:
+        """Keep per-contact interaction stats on the contact row.
+
+        interaction_count is maintained by triggers on interactions, so
+        get_contact_summary reads it instead of counting on every call.
+        Databases created before the column existed get it added and
+        backfilled once.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(contacts)")}
+        if "interaction_count" not in columns:
+            conn.execute("BEGIN")
+            conn.execute(
+                "ALTER TABLE contacts ADD COLUMN interaction_count INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.execute("""
+                UPDATE contacts SET interaction_count =
+                    (SELECT COUNT(*) FROM interactions WHERE contact_id = contacts.id)
+            """)
+            conn.execute("COMMIT")
+
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS interactions_count_ai AFTER INSERT ON interactions BEGIN
+                UPDATE contacts SET interaction_count = interaction_count + 1
+                WHERE id = new.contact_id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS interactions_count_ad AFTER DELETE ON interactions BEGIN
+                UPDATE contacts SET interaction_count = interaction_count - 1
+                WHERE id = old.contact_id;
+            END;
+        """)
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the trigram FTS5 index over contacts, kept in sync by triggers.
+
+        The trigram tokenizer supports substring matches, so it can replace
+        the LIKE '%q%' scan in search_contacts. Returns False (and search
+        keeps using LIKE) when this SQLite build lacks FTS5 or trigram.
+        """
+        cols = ", ".join(_FTS_COLUMNS)
+        new_cols = ", ".join(f"new.{c}" for c in _FTS_COLUMNS)
+        old_cols = ", ".join(f"old.{c}" for c in _FTS_COLUMNS)
+
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contacts_fts'"
+        ).fetchone()
+        try:
+            conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+                    {cols}, content='contacts', content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.info(f"FTS5 trigram index unavailable ({e}) — contact search uses LIKE")
+            return False
+
+        conn.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+                INSERT INTO contacts_fts(rowid, {cols}) VALUES (new.rowid, {new_cols});
+            END;
+            CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+                INSERT INTO contacts_fts(contacts_fts, rowid, {cols})
+                VALUES ('delete', old.rowid, {old_cols});
+            END;
+            CREATE TRIGGER IF NOT EXISTS contacts_fts_au
+            AFTER UPDATE OF {cols} ON contacts BEGIN
+                INSERT INTO contacts_fts(contacts_fts, rowid, {cols})
+                VALUES ('delete', old.rowid, {old_cols});
+                INSERT INTO contacts_fts(rowid, {cols}) VALUES (new.rowid, {new_cols});
+            END;
+        """)
+        if not exists:
+            # Index contacts that predate the FTS table
+            conn.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+        return True
+
     def _seed_sample_data(self) -> None:
         """Seed sample contacts and interactions for demo/testing."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = self._conn
 
         # Check if already seeded
         count = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
         if count > 0:
-            conn.close()
             return
 
         now = datetime.now()
@@ -211,40 +421,19 @@ class CRMTools:
             },
         ]
 
-        for c in contacts:
-            conn.execute(
-                """INSERT OR IGNORE INTO contacts
-                (id, organization_name, contact_person, email, phone, role, tags,
-                 notes, typical_rate, payment_terms, preferred_payment,
-                 relationship_status, first_contact_date, last_contact_date,
-                 last_invoice_id, upcoming_event_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    c["id"], c["organization_name"], c["contact_person"],
-                    c["email"], c["phone"], c["role"], c["tags"],
-                    c["notes"], c["typical_rate"], c["payment_terms"],
-                    c["preferred_payment"], c["relationship_status"],
-                    c["first_contact_date"], c["last_contact_date"],
-                    c["last_invoice_id"], c["upcoming_event_id"],
-                    c["created_at"], c["updated_at"],
-                ),
-            )
-
-        for i in interactions:
-            conn.execute(
-                """INSERT OR IGNORE INTO interactions
-                (id, contact_id, interaction_type, content, interaction_date,
-                 follow_up_date, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    i["id"], i["contact_id"], i["interaction_type"],
-                    i["content"], i["interaction_date"],
-                    i["follow_up_date"], i["created_at"],
-                ),
-            )
+        contact_rows = [tuple(c[k] for k in _SEED_CONTACT_COLUMNS) for c in contacts]
+        interaction_rows = [
+            tuple(i[k] for k in _SEED_INTERACTION_COLUMNS) for i in interactions
+        ]
 
-        conn.commit()
-        conn.close()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_SEED_CONTACT_SQL, contact_rows)
+            conn.executemany(_SEED_INTERACTION_SQL, interaction_rows)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
         logger.info("CRM seeded with 3 contacts and 6 interactions")
 
     # ── Tool Implementations ────────────────────────────────────────
@@ -270,24 +459,17 @@ class CRMTools:
         today = now.strftime("%Y-%m-%d")
         first_date = first_contact_date or today
 
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute(
-            """INSERT INTO contacts
-            (id, organization_name, contact_person, email, phone, role, tags,
-             notes, typical_rate, payment_terms, preferred_payment,
-             relationship_status, first_contact_date, last_contact_date,
-             created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                contact_id, organization_name, contact_person,
-                email, phone, role, json.dumps(tags or []),
-                notes, typical_rate, payment_terms, preferred_payment,
-                relationship_status, first_date, first_date,
-                now.isoformat(), now.isoformat(),
-            ),
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(
+                _CONTACT_INSERT_SQL,
+                (
+                    contact_id, organization_name, contact_person,
+                    email, phone, role, json.dumps(tags or []),
+                    notes, typical_rate, payment_terms, preferred_payment,
+                    relationship_status, first_date, first_date,
+                    now.isoformat(), now.isoformat(),
+                ),
+            )
 
         logger.info(f"[CRM] Added contact {contact_id}: {organization_name}")
         return {
@@ -307,32 +489,48 @@ class CRMTools:
         relationship_status: str | None = None,
     ) -> list[dict]:
         """Search contacts by name, role, tag, or status."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        filters = ""
+        filter_params: list = []
+
+        if role:
+            filters += " AND role = ?"
+            filter_params.append(role)
 
+        if tag:
+            # IN (…) lets the planner drive from the tag index, then seek by id
+            filters += " AND id IN (SELECT contact_id FROM contact_tags WHERE tag = ?)"
+            filter_params.append(tag.strip().lower())
+
+        if relationship_status:
+            filters += " AND relationship_status = ?"
+            filter_params.append(relationship_status)
+
+        order = " ORDER BY last_contact_date DESC"
         sql = "SELECT * FROM contacts WHERE 1=1"
         params: list = []
 
-        if query:
+        if query and self._fts_enabled and len(query) >= 3:
+            # Trigram index needs at least 3 characters; quote as a phrase
+            sql += " AND rowid IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)"
+            params.append('"' + query.replace('"', '""') + '"')
+        elif query:
             sql += " AND (organization_name LIKE ? OR contact_person LIKE ? OR email LIKE ?)"
             q = f"%{query}%"
             params.extend([q, q, q])
 
-        if role:
-            sql += " AND role = ?"
-            params.append(role)
+        rows = []
+        with self._lock:
+            # Exact email lookups hit the row directly before any text search
+            if "@" in query:
+                rows = self._conn.execute(
+                    "SELECT * FROM contacts WHERE email = ? COLLATE NOCASE" + filters + order,
+                    [query.strip(), *filter_params],
+                ).fetchall()
 
-        if tag:
-            sql += " AND tags LIKE ?"
-            params.append(f"%{tag}%")
-
-        if relationship_status:
-            sql += " AND relationship_status = ?"
-            params.append(relationship_status)
-
-        sql += " ORDER BY last_contact_date DESC"
-        rows = conn.execute(sql, params).fetchall()
-        conn.close()
+            if not rows:
+                rows = self._conn.execute(
+                    sql + filters + order, params + filter_params
+                ).fetchall()
 
         results = []
         for row in rows:
@@ -344,7 +542,7 @@ class CRMTools:
                 "phone": row["phone"],
                 "role": row["role"],
                 "relationship_status": row["relationship_status"],
-                "tags": json.loads(row["tags"]) if row["tags"] else [],
+                "tags": list(_parse_tags(row["tags"])) if row["tags"] else [],
                 "typical_rate": row["typical_rate"],
                 "last_contact_date": row["last_contact_date"],
             })
@@ -353,26 +551,22 @@ class CRMTools:
 
     def get_contact(self, contact_id: str) -> dict:
         """Get full contact profile with recent interactions."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-
-        row = conn.execute(
-            "SELECT * FROM contacts WHERE id = ?", (contact_id,)
-        ).fetchone()
-
-        if not row:
-            conn.close()
-            return {"error": f"Contact not found: {contact_id}"}
-
-        # Get last 5 interactions
-        interactions = conn.execute(
-            """SELECT * FROM interactions
-            WHERE contact_id = ?
-            ORDER BY interaction_date DESC
-            LIMIT 5""",
-            (contact_id,),
-        ).fetchall()
-        conn.close()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM contacts WHERE id = ?", (contact_id,)
+            ).fetchone()
+
+            if not row:
+                return {"error": f"Contact not found: {contact_id}"}
+
+            # Get last 5 interactions
+            interactions = self._conn.execute(
+                """SELECT * FROM interactions
+                WHERE contact_id = ?
+                ORDER BY interaction_date DESC
+                LIMIT 5""",
+                (contact_id,),
+            ).fetchall()
 
         interaction_list = [
             {
@@ -392,7 +586,7 @@ class CRMTools:
             "email": row["email"],
             "phone": row["phone"],
             "role": row["role"],
-            "tags": json.loads(row["tags"]) if row["tags"] else [],
+            "tags": list(_parse_tags(row["tags"])) if row["tags"] else [],
             "notes": row["notes"],
             "typical_rate": row["typical_rate"],
             "payment_terms": row["payment_terms"],
@@ -407,40 +601,28 @@ class CRMTools:
 
     def update_contact(self, contact_id: str, updates: dict) -> dict:
         """Update contact fields."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-
-        allowed = {
-            "organization_name", "contact_person", "email", "phone",
-            "role", "tags", "notes", "typical_rate", "payment_terms",
-            "preferred_payment", "relationship_status",
-            "last_invoice_id", "upcoming_event_id",
-        }
-        filtered = {k: v for k, v in updates.items() if k in allowed}
+        filtered = {k: v for k, v in updates.items() if k in _UPDATABLE_CONTACT_FIELDS}
 
         if not filtered:
-            conn.close()
-            return {"error": f"No valid fields to update. Allowed: {', '.join(sorted(allowed))}"}
+            return {
+                "error": "No valid fields to update. "
+                f"Allowed: {', '.join(sorted(_UPDATABLE_CONTACT_FIELDS))}"
+            }
 
         # Serialize tags if present
         if "tags" in filtered and isinstance(filtered["tags"], list):
             filtered["tags"] = json.dumps(filtered["tags"])
 
-        set_clauses = []
-        params = []
-        for key, value in filtered.items():
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
-
-        # Always update the updated_at timestamp
-        set_clauses.append("updated_at = ?")
-        params.append(datetime.now().isoformat())
-        params.append(contact_id)
+        # updated_at is always set; the statement is cached per field set
+        fields = tuple(sorted(filtered))
+        params = [
+            *(filtered[field] for field in fields),
+            datetime.now().isoformat(),
+            contact_id,
+        ]
 
-        conn.execute(
-            f"UPDATE contacts SET {', '.join(set_clauses)} WHERE id = ?", params
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_update_contact_sql(fields), params)
 
         return {"status": "updated", "contact_id": contact_id, "updates": updates}
 
@@ -457,46 +639,55 @@ class CRMTools:
         now = datetime.now()
         int_date = interaction_date or now.strftime("%Y-%m-%d")
 
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-
-        # Verify contact exists
-        contact = conn.execute(
-            "SELECT organization_name FROM contacts WHERE id = ?", (contact_id,)
-        ).fetchone()
-        if not contact:
-            conn.close()
-            return {"error": f"Contact not found: {contact_id}"}
-
-        conn.execute(
-            """INSERT INTO interactions
-            (id, contact_id, interaction_type, content, interaction_date,
-             follow_up_date, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                interaction_id, contact_id, interaction_type,
-                content, int_date, follow_up_date, now.isoformat(),
-            ),
-        )
-
-        # Auto-update last_contact_date on the contact
-        conn.execute(
-            "UPDATE contacts SET last_contact_date = ?, updated_at = ? WHERE id = ?",
-            (int_date, now.isoformat(), contact_id),
-        )
-
-        conn.commit()
-        conn.close()
+        touch_params = (int_date, now.isoformat(), contact_id)
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                # Auto-update last_contact_date on the contact (never moves
+                # backwards when an older interaction is logged after the
+                # fact). With RETURNING the update doubles as the existence
+                # check; older SQLite builds look the contact up first.
+                if _HAS_RETURNING:
+                    contact = conn.execute(
+                        _TOUCH_CONTACT_SQL + " RETURNING organization_name", touch_params
+                    ).fetchall()
+                else:
+                    contact = conn.execute(
+                        "SELECT organization_name FROM contacts WHERE id = ?", (contact_id,)
+                    ).fetchall()
+                    if contact:
+                        conn.execute(_TOUCH_CONTACT_SQL, touch_params)
+
+                if not contact:
+                    conn.execute("ROLLBACK")
+                    return {"error": f"Contact not found: {contact_id}"}
+
+                conn.execute(
+                    _INTERACTION_INSERT_SQL,
+                    (
+                        interaction_id, contact_id, interaction_type,
+                        content, int_date, follow_up_date, now.isoformat(),
+                    ),
+                )
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        contact_name = contact[0][0]
 
         logger.info(f"[CRM] Added interaction {interaction_id} for {contact_id}")
         return {
             "status": "logged",
             "interaction_id": interaction_id,
             "contact_id": contact_id,
-            "contact_name": contact[0],
+            "contact_name": contact_name,
             "interaction_type": interaction_type,
             "interaction_date": int_date,
             "follow_up_date": follow_up_date,
-            "message": f"Interaction logged for {contact[0]}.",
+            "message": f"Interaction logged for {contact_name}.",
         }
 
     def list_interactions(
@@ -507,9 +698,6 @@ class CRMTools:
         interaction_type: str | None = None,
     ) -> list[dict]:
         """List interactions for a contact with optional filters."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-
         sql = "SELECT * FROM interactions WHERE contact_id = ?"
         params: list = [contact_id]
 
@@ -524,8 +712,8 @@ class CRMTools:
             params.append(interaction_type)
 
         sql += " ORDER BY interaction_date DESC"
-        rows = conn.execute(sql, params).fetchall()
-        conn.close()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
 
         return [
             {
@@ -540,77 +728,73 @@ class CRMTools:
 
     def get_contact_summary(self, contact_id: str) -> dict:
         """Relationship overview — cross-references invoices and events."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-
-        # Get the contact
-        contact = conn.execute(
-            "SELECT * FROM contacts WHERE id = ?", (contact_id,)
-        ).fetchone()
-        if not contact:
-            conn.close()
-            return {"error": f"Contact not found: {contact_id}"}
-
-        org_name = contact["organization_name"]
-        email = contact["email"]
-
-        # Cross-reference invoices by client_name or client_email
-        invoice_rows = conn.execute(
-            """SELECT i.id, i.invoice_number, i.status, i.invoice_date,
-                      COALESCE(SUM(li.amount), 0) as total
-               FROM invoices i
-               LEFT JOIN invoice_line_items li ON i.id = li.invoice_id
-               WHERE i.client_name = ? OR i.client_email = ?
-               GROUP BY i.id
-               ORDER BY i.invoice_date DESC""",
-            (org_name, email),
-        ).fetchall()
-
-        total_invoiced = sum(r["total"] for r in invoice_rows)
-        total_paid = sum(r["total"] for r in invoice_rows if r["status"] == "paid")
-        total_outstanding = sum(
-            r["total"] for r in invoice_rows if r["status"] not in ("paid", "cancelled")
-        )
-
-        # Cross-reference events by venue or contact_info
-        try:
-            event_rows = conn.execute(
-                """SELECT * FROM events
-                   WHERE venue = ? OR contact_info LIKE ?
-                   ORDER BY start_time DESC""",
-                (org_name, f"%{email}%"),
+        with self._lock:
+            conn = self._conn
+
+            # The contact and its latest interaction in one statement
+            contact = conn.execute(
+                """SELECT c.*,
+                          last.interaction_type AS last_type,
+                          last.interaction_date AS last_date,
+                          last.content AS last_content
+                   FROM contacts c
+                   LEFT JOIN (
+                       SELECT interaction_type, interaction_date, content
+                       FROM interactions WHERE contact_id = ?
+                       ORDER BY interaction_date DESC LIMIT 1
+                   ) AS last
+                   WHERE c.id = ?""",
+                (contact_id, contact_id),
+            ).fetchone()
+            if not contact:
+                return {"error": f"Contact not found: {contact_id}"}
+
+            org_name = contact["organization_name"]
+            email = contact["email"]
+
+            # Cross-reference invoices by client_name or client_email; the
+            # per-invoice totals are rolled up in SQL, not fetched and summed
+            invoice_count, total_invoiced, total_paid, total_outstanding = conn.execute(
+                """SELECT COUNT(*),
+                          COALESCE(SUM(total), 0),
+                          COALESCE(SUM(CASE WHEN status = 'paid' THEN total ELSE 0 END), 0),
+                          COALESCE(SUM(CASE WHEN COALESCE(status, '') NOT IN ('paid', 'cancelled')
+                                            THEN total ELSE 0 END), 0)
+                   FROM (
+                       SELECT i.status, COALESCE(SUM(li.amount), 0) AS total
+                       FROM invoices i
+                       LEFT JOIN invoice_line_items li ON i.id = li.invoice_id
+                       WHERE i.client_name = ? OR i.client_email = ?
+                       GROUP BY i.id
+                   )""",
+                (org_name, email),
+            ).fetchone()
+
+            # Cross-reference events by venue or contact_info — only the
+            # count and pay total are reported, so SQLite aggregates them
+            try:
+                event_count, total_event_pay = conn.execute(
+                    """SELECT COUNT(*), COALESCE(SUM(pay), 0) FROM events
+                       WHERE venue = ? OR contact_info LIKE ?""",
+                    (org_name, f"%{email}%"),
+                ).fetchone()
+            except Exception:
+                # Events table might not exist if calendar hasn't been used
+                event_count = 0
+                total_event_pay = 0.0
+
+            # Interaction stats — the count is kept on the contact row
+            interaction_count = contact["interaction_count"]
+
+            # Pending follow-ups
+            today = datetime.now().strftime("%Y-%m-%d")
+            follow_ups = conn.execute(
+                """SELECT interaction_type, content, follow_up_date
+                   FROM interactions
+                   WHERE contact_id = ? AND follow_up_date IS NOT NULL AND follow_up_date >= ?
+                   ORDER BY follow_up_date ASC""",
+                (contact_id, today),
             ).fetchall()
-            event_count = len(event_rows)
-            total_event_pay = sum(r["pay"] or 0 for r in event_rows)
-        except Exception:
-            # Events table might not exist if calendar hasn't been used
-            event_count = 0
-            total_event_pay = 0.0
-
-        # Get interaction stats
-        interaction_count = conn.execute(
-            "SELECT COUNT(*) FROM interactions WHERE contact_id = ?",
-            (contact_id,),
-        ).fetchone()[0]
-
-        last_interaction = conn.execute(
-            """SELECT interaction_type, interaction_date, content
-               FROM interactions WHERE contact_id = ?
-               ORDER BY interaction_date DESC LIMIT 1""",
-            (contact_id,),
-        ).fetchone()
-
-        # Pending follow-ups
-        today = datetime.now().strftime("%Y-%m-%d")
-        follow_ups = conn.execute(
-            """SELECT interaction_type, content, follow_up_date
-               FROM interactions
-               WHERE contact_id = ? AND follow_up_date IS NOT NULL AND follow_up_date >= ?
-               ORDER BY follow_up_date ASC""",
-            (contact_id, today),
-        ).fetchall()
-
-        conn.close()
 
         return {
             "contact_id": contact_id,
@@ -621,7 +805,7 @@ class CRMTools:
             "first_contact_date": contact["first_contact_date"],
             "last_contact_date": contact["last_contact_date"],
             # Invoice summary
-            "invoice_count": len(invoice_rows),
+            "invoice_count": invoice_count,
             "total_invoiced": total_invoiced,
             "total_paid": total_paid,
             "total_outstanding": total_outstanding,
@@ -631,10 +815,10 @@ class CRMTools:
             # Interaction summary
             "interaction_count": interaction_count,
             "last_interaction": {
-                "type": last_interaction["interaction_type"],
-                "date": last_interaction["interaction_date"],
-                "content": last_interaction["content"][:100] + "..." if len(last_interaction["content"]) > 100 else last_interaction["content"],
-            } if last_interaction else None,
+                "type": contact["last_type"],
+                "date": contact["last_date"],
+                "content": contact["last_content"][:100] + "..." if len(contact["last_content"]) > 100 else contact["last_content"],
+            } if contact["last_type"] is not None else None,
             # Follow-ups
             "pending_follow_ups": [
                 {
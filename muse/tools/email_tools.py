@@ -11,8 +11,12 @@ import base64
 import json
 import logging
 import os
+import re
 import sqlite3
+import time
 import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from email.mime.text import MIMEText
 from typing import Optional
@@ -32,6 +36,33 @@ except ImportError:
 
 MAX_BODY_LENGTH = 10000
 
+# Gmail list/search results are reused while the mailbox is unchanged
+RESULT_CACHE_TTL = 30  # seconds
+RESULT_CACHE_SIZE = 128
+
+# One Gmail search term: optional negation, optional operator, then a quoted
+# phrase or a bare word
+_QUERY_TERM = re.compile(r'-?(?:[A-Za-z_]+:)?(?:"[^"]*"|\S+)')
+_QUERY_OPERATOR = re.compile(r"^(-?)([A-Za-z_]+):")
+
+
+@lru_cache(maxsize=256)
+def _canonicalize_query(query: str) -> str:
+    """Canonical form of a Gmail query, so equivalent spellings share a cache entry.
+
+    Only used as the cache key; Gmail still gets the query as written.
+    Collapses whitespace and lowercases operator names. When the terms are
+    purely ANDed (no OR, grouping, braces or positional AROUND) their order
+    doesn't matter to Gmail, so they are also sorted.
+    """
+    terms = [
+        _QUERY_OPERATOR.sub(lambda m: f"{m.group(1)}{m.group(2).lower()}:", term)
+        for term in _QUERY_TERM.findall(query)
+    ]
+    if not any(t in ("OR", "AND", "AROUND", "|") or t[0] in "({" or t[-1] in ")}" for t in terms):
+        terms.sort()
+    return " ".join(terms)
+
 
 class EmailTools:
     """Wraps Gmail API (or local fallback) for the Email Agent."""
@@ -40,6 +71,8 @@ class EmailTools:
         self.service = None
         self.use_local = not GOOGLE_AVAILABLE
         self.db_path = config.DB_PATH
+        # (kind, *args) → (stored_at, history_id, results)
+        self._result_cache: OrderedDict[tuple, tuple[float, str, list[dict]]] = OrderedDict()
 
         if not self.use_local:
             try:
@@ -200,7 +233,10 @@ class EmailTools:
         """List emails from a label/folder."""
         if self.use_local:
             return self._local_list_emails(max_results, label, unread_only)
-        return self._google_list_emails(max_results, label, unread_only)
+        return self._cached_google_results(
+            ("list", max_results, label, unread_only),
+            lambda: self._google_list_emails(max_results, label, unread_only),
+        )
 
     def read_email(self, message_id: str) -> dict:
         """Read the full content of an email by ID."""
@@ -212,7 +248,10 @@ class EmailTools:
         """Search emails using Gmail query syntax (or substring for local)."""
         if self.use_local:
             return self._local_search_emails(query, max_results)
-        return self._google_search_emails(query, max_results)
+        return self._cached_google_results(
+            ("search", _canonicalize_query(query), max_results),
+            lambda: self._google_search_emails(query, max_results),
+        )
 
     def draft_reply(
         self,
@@ -245,14 +284,24 @@ class EmailTools:
 
     def modify_labels(
         self,
-        message_id: str,
+        message_id: str | None = None,
         add_labels: list[str] | None = None,
         remove_labels: list[str] | None = None,
+        message_ids: list[str] | None = None,
     ) -> dict:
-        """Add/remove labels on a message."""
+        """Add/remove labels on one message, or the same change on several."""
+        ids = list(dict.fromkeys([*(message_ids or []), *([message_id] if message_id else [])]))
+        if not ids:
+            return {"error": "Provide message_id or message_ids"}
+
+        if len(ids) == 1:
+            if self.use_local:
+                return self._local_modify_labels(ids[0], add_labels, remove_labels)
+            return self._google_modify_labels(ids[0], add_labels, remove_labels)
+
         if self.use_local:
-            return self._local_modify_labels(message_id, add_labels, remove_labels)
-        return self._google_modify_labels(message_id, add_labels, remove_labels)
+            return self._local_batch_modify_labels(ids, add_labels, remove_labels)
+        return self._google_batch_modify_labels(ids, add_labels, remove_labels)
 
     def extract_gig_details(self, message_id: str) -> dict:
         """Read an email and return content for gig detail extraction."""
@@ -260,6 +309,31 @@ class EmailTools:
 
     # ── Google Gmail Implementations ────────────────────────────────
 
+    def _cached_google_results(self, key: tuple, fetch) -> list[dict]:
+        """Serve a list/search result from cache while the mailbox is unchanged.
+
+        A fresh list costs one messages.list plus one messages.get per
+        message; validating the cache costs a single users.getProfile call.
+        Entries are dropped once the mailbox historyId moves (any new mail or
+        label change) or after RESULT_CACHE_TTL seconds.
+        """
+        history_id = (
+            self.service.users().getProfile(userId="me").execute().get("historyId", "")
+        )
+        now = time.monotonic()
+
+        cached = self._result_cache.get(key)
+        if cached and cached[1] == history_id and now - cached[0] < RESULT_CACHE_TTL:
+            self._result_cache.move_to_end(key)
+            return cached[2]
+
+        results = fetch()
+        self._result_cache[key] = (now, history_id, results)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return results
+
     def _decode_body(self, payload: dict) -> str:
         """Recursively extract text/plain body from Gmail message payload."""
         if payload.get("mimeType") == "text/plain" and payload.get("body", {}).get("data"):
@@ -511,6 +585,28 @@ class EmailTools:
             "removed": remove_labels or [],
         }
 
+    def _google_batch_modify_labels(
+        self,
+        message_ids: list[str],
+        add_labels: list[str] | None,
+        remove_labels: list[str] | None,
+    ) -> dict:
+        # batchModify takes up to 1000 IDs per request
+        for start in range(0, len(message_ids), 1000):
+            body: dict = {"ids": message_ids[start:start + 1000]}
+            if add_labels:
+                body["addLabelIds"] = add_labels
+            if remove_labels:
+                body["removeLabelIds"] = remove_labels
+            self.service.users().messages().batchModify(userId="me", body=body).execute()
+
+        return {
+            "status": "labels_updated",
+            "message_ids": message_ids,
+            "added": add_labels or [],
+            "removed": remove_labels or [],
+        }
+
     # ── Local SQLite Implementations ────────────────────────────────
 
     def _local_list_emails(
@@ -763,3 +859,24 @@ class EmailTools:
             "added": add_labels or [],
             "removed": remove_labels or [],
         }
+
+    def _local_batch_modify_labels(
+        self,
+        message_ids: list[str],
+        add_labels: list[str] | None,
+        remove_labels: list[str] | None,
+    ) -> dict:
+        updated, not_found = [], []
+        for message_id in message_ids:
+            result = self._local_modify_labels(message_id, add_labels, remove_labels)
+            (not_found if "error" in result else updated).append(message_id)
+
+        response = {
+            "status": "labels_updated",
+            "message_ids": updated,
+            "added": add_labels or [],
+            "removed": remove_labels or [],
+        }
+        if not_found:
+            response["not_found"] = not_found
+        return response
@@ -11,6 +11,8 @@ import json
 import logging
 import os
 import sqlite3
+import stat
+import tempfile
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
@@ -40,6 +42,12 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     logger.info("ReportLab not installed — PDF generation disabled")
 
+# Mode open() gives a new file under the process umask. The umask can only
+# be read by setting it, so do that once here rather than on each PDF call.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
 
 class InvoiceTools:
     """Handles invoice CRUD and PDF generation for the Invoice Agent."""
@@ -86,6 +94,21 @@ class InvoiceTools:
                 FOREIGN KEY(invoice_id) REFERENCES invoices(id)
             )
         """)
+        # Line items are always fetched/summed per invoice; listings and
+        # income summaries filter on invoice_date ranges
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_line_items_invoice ON invoice_line_items(invoice_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_invoices_date ON invoices(invoice_date)"
+        )
+        # The CRM summary finds a contact's invoices by client name OR email
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_invoices_client_name ON invoices(client_name)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_invoices_client_email ON invoices(client_email)"
+        )
         conn.commit()
         conn.close()
         self._seed_sample_invoices()
@@ -293,32 +316,30 @@ class InvoiceTools:
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
 
-        query = "SELECT * FROM invoices WHERE 1=1"
+        # Line-item totals are aggregated in the same query (one pass, no
+        # per-invoice lookups); the date range prunes via idx_invoices_date
+        query = """SELECT i.*, COALESCE(SUM(li.amount), 0) AS total,
+                          COUNT(li.id) AS line_item_count
+                   FROM invoices i
+                   LEFT JOIN invoice_line_items li ON li.invoice_id = i.id
+                   WHERE 1=1"""
         params: list = []
 
         if start_date:
-            query += " AND invoice_date >= ?"
+            query += " AND i.invoice_date >= ?"
             params.append(start_date)
         if end_date:
-            query += " AND invoice_date <= ?"
+            query += " AND i.invoice_date <= ?"
             params.append(end_date)
         if status:
-            query += " AND status = ?"
+            query += " AND i.status = ?"
             params.append(status)
 
-        query += " ORDER BY invoice_date DESC"
+        query += " GROUP BY i.id ORDER BY i.invoice_date DESC"
         rows = conn.execute(query, params).fetchall()
 
-        invoices = []
-        for row in rows:
-            # Get line items for each invoice
-            items = conn.execute(
-                "SELECT * FROM invoice_line_items WHERE invoice_id = ?",
-                (row["id"],),
-            ).fetchall()
-            total = sum(item["amount"] for item in items)
-
-            invoices.append({
+        invoices = [
+            {
                 "id": row["id"],
                 "invoice_number": row["invoice_number"],
                 "client_name": row["client_name"],
@@ -326,10 +347,12 @@ class InvoiceTools:
                 "status": row["status"],
                 "invoice_date": row["invoice_date"],
                 "due_date": row["due_date"],
-                "total": total,
-                "line_item_count": len(items),
+                "total": row["total"],
+                "line_item_count": row["line_item_count"],
                 "payment_date": row["payment_date"],
-            })
+            }
+            for row in rows
+        ]
 
         conn.close()
         return invoices
@@ -476,7 +499,22 @@ class InvoiceTools:
             }
         else:
             filepath = os.path.join(self.output_dir, filename)
-            self._build_pdf(invoice_data, filepath)
+            # Render straight into a temp file beside the target, then swap it
+            # in, so concurrent calls never expose a half-written PDF
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".pdf.tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    self._build_pdf(invoice_data, f)
+                # mkstemp creates 0600; keep the mode open() would have left
+                try:
+                    mode = stat.S_IMODE(os.stat(filepath).st_mode)
+                except FileNotFoundError:
+                    mode = _NEW_FILE_MODE
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
 
             return {
                 "status": "pdf_generated",
@@ -497,56 +535,57 @@ class InvoiceTools:
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
 
-        query = "SELECT i.*, COALESCE(SUM(li.amount), 0) as total FROM invoices i LEFT JOIN invoice_line_items li ON i.id = li.invoice_id WHERE 1=1"
+        where = ""
         params: list = []
-
         if start_date:
-            query += " AND i.invoice_date >= ?"
+            where += " AND i.invoice_date >= ?"
             params.append(start_date)
         if end_date:
-            query += " AND i.invoice_date <= ?"
+            where += " AND i.invoice_date <= ?"
             params.append(end_date)
 
-        query += " GROUP BY i.id"
-        rows = conn.execute(query, params).fetchall()
+        # Per-invoice totals, then one aggregate pass. Cancelled invoices count
+        # toward total_invoiced but are neither paid nor outstanding. "today"
+        # is passed in (local time) rather than SQL date('now'), which is UTC.
+        row = conn.execute(
+            f"""WITH totals AS (
+                SELECT COALESCE(i.status, '') AS status, i.due_date,
+                       COALESCE(SUM(li.amount), 0) AS total
+                FROM invoices i
+                LEFT JOIN invoice_line_items li ON li.invoice_id = i.id
+                WHERE 1=1{where}
+                GROUP BY i.id
+            ), flagged AS (
+                SELECT total,
+                       status = 'paid' AS is_paid,
+                       status NOT IN ('paid', 'cancelled') AS is_open,
+                       status NOT IN ('paid', 'cancelled')
+                           AND due_date IS NOT NULL AND due_date != ''
+                           AND due_date < ? AS is_overdue
+                FROM totals
+            )
+            SELECT COUNT(*) AS invoice_count,
+                   COALESCE(SUM(total), 0.0) AS total_invoiced,
+                   COALESCE(SUM(total * is_paid), 0.0) AS total_paid,
+                   COALESCE(SUM(total * is_open), 0.0) AS total_outstanding,
+                   COALESCE(SUM(total * is_overdue), 0.0) AS total_overdue,
+                   COALESCE(SUM(is_paid), 0) AS paid_count,
+                   COALESCE(SUM(is_open), 0) AS outstanding_count,
+                   COALESCE(SUM(is_overdue), 0) AS overdue_count
+            FROM flagged""",
+            [*params, datetime.now().strftime("%Y-%m-%d")],
+        ).fetchone()
         conn.close()
 
-        total_invoiced = 0.0
-        total_paid = 0.0
-        total_outstanding = 0.0
-        total_overdue = 0.0
-        invoice_count = len(rows)
-        paid_count = 0
-        outstanding_count = 0
-        overdue_count = 0
-
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        for row in rows:
-            amount = row["total"]
-            total_invoiced += amount
-
-            if row["status"] == "paid":
-                total_paid += amount
-                paid_count += 1
-            elif row["status"] == "cancelled":
-                pass  # Skip cancelled
-            else:
-                total_outstanding += amount
-                outstanding_count += 1
-                if row["due_date"] and row["due_date"] < today:
-                    total_overdue += amount
-                    overdue_count += 1
-
         return {
-            "total_invoiced": total_invoiced,
-            "total_paid": total_paid,
-            "total_outstanding": total_outstanding,
-            "total_overdue": total_overdue,
-            "invoice_count": invoice_count,
-            "paid_count": paid_count,
-            "outstanding_count": outstanding_count,
-            "overdue_count": overdue_count,
+            "total_invoiced": float(row["total_invoiced"]),
+            "total_paid": float(row["total_paid"]),
+            "total_outstanding": float(row["total_outstanding"]),
+            "total_overdue": float(row["total_overdue"]),
+            "invoice_count": row["invoice_count"],
+            "paid_count": row["paid_count"],
+            "outstanding_count": row["outstanding_count"],
+            "overdue_count": row["overdue_count"],
             "period": {
                 "start": start_date or "all time",
                 "end": end_date or "present",
@@ -12,6 +12,7 @@ import logging
 import sqlite3
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from muse.config import config
@@ -58,6 +59,23 @@ HASHTAG_LIBRARY = {
 }
 
 
+@lru_cache(maxsize=256)
+def _select_hashtags(topic_lower: str, count: int) -> tuple[str, ...]:
+    """Hashtags for a normalized topic. Pure over HASHTAG_LIBRARY, so memoized."""
+    selected: list[str] = []
+
+    # Match topic against hashtag categories
+    for category, tags in HASHTAG_LIBRARY.items():
+        if category in topic_lower:
+            selected.extend(tags)
+
+    # Always include general music hashtags
+    selected.extend(HASHTAG_LIBRARY["general"])
+
+    # Deduplicate while preserving order, then trim to requested count
+    return tuple(dict.fromkeys(selected))[:count]
+
+
 class SocialTools:
     """Social media post management with voice-matched caption generation."""
 
@@ -376,6 +394,7 @@ class SocialTools:
         query: str,
         n_results: int = 3,
         category: str | None = None,
+        recency_weight: float = 0.0,
     ) -> dict:
         """Retrieve voice samples relevant to a query.
 
@@ -385,6 +404,7 @@ class SocialTools:
             query=query,
             n_results=n_results,
             category=category,
+            recency_weight=recency_weight,
         )
 
     def add_voice_sample(
@@ -428,27 +448,7 @@ class SocialTools:
         Returns:
             Dict with hashtag suggestions.
         """
-        topic_lower = topic.lower()
-        selected: list[str] = []
-
-        # Match topic against hashtag categories
-        for category, tags in HASHTAG_LIBRARY.items():
-            if category in topic_lower:
-                selected.extend(tags)
-
-        # Always include general music hashtags
-        selected.extend(HASHTAG_LIBRARY["general"])
-
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        unique: list[str] = []
-        for tag in selected:
-            if tag not in seen:
-                seen.add(tag)
-                unique.append(tag)
-
-        # Trim to requested count
-        hashtags = unique[:count]
+        hashtags = list(_select_hashtags(topic.lower().strip(), count))
 
         return {
             "topic": topic,
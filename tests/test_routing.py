@@ -0,0 +1,83 @@
+"""Routing tests for the Orchestrator's keyword pre-router.
+
+Usage:
+    python -m pytest tests/test_routing.py
+
+No API key needed: the model router is replaced by a stub client.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+
+from muse.orchestrator import Orchestrator, _keyword_category
+
+
+class _StubMessages:
+    """Stands in for client.messages: replies with a fixed category."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.calls = 0
+
+    @contextmanager
+    def stream(self, **kwargs):
+        self.calls += 1
+        yield type("Stream", (), {"text_stream": iter([self.reply])})()
+
+
+class _StubClient:
+    def __init__(self, reply: str):
+        self.messages = _StubMessages(reply)
+
+
+# Example prompts from the CLI scripts and README, with their intended agent
+_CROSS_DOMAIN_PROMPTS = [
+    ("Extract the gig details from that booking email", "EMAIL"),
+    ("Draft a reply saying I'm interested but need to check my schedule", "EMAIL"),
+    ("Draft a post about my gig at The Earl this Saturday", "SOCIAL"),
+]
+
+_UNAMBIGUOUS_PROMPTS = [
+    ("Check my inbox", "EMAIL"),
+    ("Write a caption with a few hashtags", "SOCIAL"),
+    ("Add a rehearsal to my calendar for Thursday", "CALENDAR"),
+    ("Create an invoice for The Earl", "INVOICE"),
+    ("List my contacts", "CRM"),
+]
+
+
+def test_cross_domain_prompts_skip_keyword_route():
+    for prompt, _ in _CROSS_DOMAIN_PROMPTS:
+        assert _keyword_category(prompt) is None, prompt
+
+
+def test_cross_domain_prompts_use_model_router():
+    for prompt, expected in _CROSS_DOMAIN_PROMPTS:
+        client = _StubClient(expected)
+        orchestrator = Orchestrator(client=client)
+        assert orchestrator._classify(prompt) == expected, prompt
+        assert client.messages.calls == 1, prompt
+
+
+def test_unambiguous_prompts_route_by_keyword():
+    for prompt, expected in _UNAMBIGUOUS_PROMPTS:
+        assert _keyword_category(prompt) == expected, prompt
+
+
+def test_keyword_route_skips_model_router():
+    client = _StubClient("GENERAL")
+    orchestrator = Orchestrator(client=client)
+    assert orchestrator._classify("Check my inbox") == "EMAIL"
+    assert client.messages.calls == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"ok  {name}")